@@ -58,6 +58,12 @@ assert precision == 'f64' or precision == 'f32', (
 if precision == 'f64':
   jax.config.update('jax_enable_x64', True)
 
+# Optionally persist compiled functions across runs, so that only the first run
+# of a given config pays the compilation cost.
+compilation_cache_dir = os.getenv('TORAX_COMPILATION_CACHE_DIR')
+if compilation_cache_dir:
+  jax.config.update('jax_compilation_cache_dir', compilation_cache_dir)
+
 CellVariable = fvm.cell_variable.CellVariable
 
 # Throughout TORAX, we maintain the following canonical argument order for
@@ -78,21 +78,17 @@ def calculate_pereverzev_flux(
 
   # remove Pereverzev flux from boundary region if pedestal model is on
   # (for PDE stability)
+  in_pedestal_region = jnp.logical_and(
+      dynamic_runtime_params_slice.profile_conditions.set_pedestal,
+      geo.r_face_norm > dynamic_runtime_params_slice.profile_conditions.Ped_top,
+  )
   chi_face_per_ion = jnp.where(
-      jnp.logical_and(
-          dynamic_runtime_params_slice.profile_conditions.set_pedestal,
-          geo.r_face_norm
-          > dynamic_runtime_params_slice.profile_conditions.Ped_top,
-      ),
+      in_pedestal_region,
       0.0,
       chi_face_per_ion,
   )
   chi_face_per_el = jnp.where(
-      jnp.logical_and(
-          dynamic_runtime_params_slice.profile_conditions.set_pedestal,
-          geo.r_face_norm
-          > dynamic_runtime_params_slice.profile_conditions.Ped_top,
-      ),
+      in_pedestal_region,
       0.0,
       chi_face_per_el,
   )
@@ -109,21 +105,13 @@ def calculate_pereverzev_flux(
   )
 
   d_face_per_el = jnp.where(
-      jnp.logical_and(
-          dynamic_runtime_params_slice.profile_conditions.set_pedestal,
-          geo.r_face_norm
-          > dynamic_runtime_params_slice.profile_conditions.Ped_top,
-      ),
+      in_pedestal_region,
       0.0,
       d_face_per_el * geo.g1_over_vpr_face / geo.rmax,
   )
 
   v_face_per_el = jnp.where(
-      jnp.logical_and(
-          dynamic_runtime_params_slice.profile_conditions.set_pedestal,
-          geo.r_face_norm
-          > dynamic_runtime_params_slice.profile_conditions.Ped_top,
-      ),
+      in_pedestal_region,
       0.0,
       v_face_per_el * geo.g0_face / geo.rmax,
   )
@@ -442,59 +430,33 @@ def _calc_coeffs_full(
   # Apply outer patch constant transport coefficients.
   # Due to Pereverzev-Corrigan convection, it is required
   # for the convection modes to be 'ghost' to avoid numerical instability
-  chi_face_ion = jnp.where(
+  in_outer_patch = jnp.logical_and(
       jnp.logical_and(
-          jnp.logical_and(
-              dynamic_runtime_params_slice.transport.apply_outer_patch,
-              jnp.logical_not(
-                  dynamic_runtime_params_slice.profile_conditions.set_pedestal
-              ),
+          dynamic_runtime_params_slice.transport.apply_outer_patch,
+          jnp.logical_not(
+              dynamic_runtime_params_slice.profile_conditions.set_pedestal
           ),
-          geo.r_face_norm
-          > dynamic_runtime_params_slice.transport.rho_outer - consts.eps,
       ),
+      geo.r_face_norm
+      > dynamic_runtime_params_slice.transport.rho_outer - consts.eps,
+  )
+  chi_face_ion = jnp.where(
+      in_outer_patch,
       dynamic_runtime_params_slice.transport.chii_outer,
       chi_face_ion,
   )
   chi_face_el = jnp.where(
-      jnp.logical_and(
-          jnp.logical_and(
-              dynamic_runtime_params_slice.transport.apply_outer_patch,
-              jnp.logical_not(
-                  dynamic_runtime_params_slice.profile_conditions.set_pedestal
-              ),
-          ),
-          geo.r_face_norm
-          > dynamic_runtime_params_slice.transport.rho_outer - consts.eps,
-      ),
+      in_outer_patch,
       dynamic_runtime_params_slice.transport.chie_outer,
       chi_face_el,
   )
   d_face_el = jnp.where(
-      jnp.logical_and(
-          jnp.logical_and(
-              dynamic_runtime_params_slice.transport.apply_outer_patch,
-              jnp.logical_not(
-                  dynamic_runtime_params_slice.profile_conditions.set_pedestal
-              ),
-          ),
-          geo.r_face_norm
-          > dynamic_runtime_params_slice.transport.rho_outer - consts.eps,
-      ),
+      in_outer_patch,
       dynamic_runtime_params_slice.transport.De_outer,
       d_face_el,
   )
   v_face_el = jnp.where(
-      jnp.logical_and(
-          jnp.logical_and(
-              dynamic_runtime_params_slice.transport.apply_outer_patch,
-              jnp.logical_not(
-                  dynamic_runtime_params_slice.profile_conditions.set_pedestal
-              ),
-          ),
-          geo.r_face_norm
-          > dynamic_runtime_params_slice.transport.rho_outer - consts.eps,
-      ),
+      in_outer_patch,
       dynamic_runtime_params_slice.transport.Ve_outer,
       v_face_el,
   )
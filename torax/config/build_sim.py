@@ -586,6 +586,28 @@ def build_transport_model_builder_from_config(
   raise ValueError(f'Unknown transport model: {transport_model}')
 
 
+# Maps each `stepper_type` to its builder, its runtime params and the key of
+# its nested params in the stepper config, if any.
+_STEPPER_TYPES = {
+    'linear': (
+        linear_theta_method.LinearThetaMethodBuilder,
+        linear_theta_method.LinearRuntimeParams,
+        None,
+    ),
+    'newton_raphson': (
+        nonlinear_theta_method.NewtonRaphsonThetaMethodBuilder,
+        nonlinear_theta_method.NewtonRaphsonRuntimeParams,
+        'newton_raphson_params',
+    ),
+    'optimizer': (
+        nonlinear_theta_method.OptimizerThetaMethodBuilder,
+        nonlinear_theta_method.OptimizerRuntimeParams,
+        'optimizer_params',
+    ),
+}
+_NESTED_STEPPER_PARAMS_KEYS = ('newton_raphson_params', 'optimizer_params')
+
+
 def build_stepper_builder_from_config(
     stepper_config: dict[str, Any],
 ) -> stepper_lib.StepperBuilder:
@@ -630,39 +652,23 @@ def build_stepper_builder_from_config(
     # Shallow copy so we don't modify the input config.
     stepper_config = copy.copy(stepper_config)
   stepper_type = stepper_config.pop('stepper_type')
-  if stepper_type == 'linear':
-    # Remove params from steppers with nested configs, if present.
-    stepper_config.pop('newton_raphson_params', None)
-    stepper_config.pop('optimizer_params', None)
-    return linear_theta_method.LinearThetaMethodBuilder(
-        runtime_params=config_args.recursive_replace(
-            linear_theta_method.LinearRuntimeParams(),
-            **stepper_config,
-        )
-    )
-  elif stepper_type == 'newton_raphson':
-    newton_raphson_params = stepper_config.pop('newton_raphson_params', {})
-    newton_raphson_params.update(stepper_config)
-    # Remove params from other steppers with nested configs, if present.
-    newton_raphson_params.pop('optimizer_params', None)
-    return nonlinear_theta_method.NewtonRaphsonThetaMethodBuilder(
-        runtime_params=config_args.recursive_replace(
-            nonlinear_theta_method.NewtonRaphsonRuntimeParams(),
-            **newton_raphson_params,
-        )
-    )
-  elif stepper_type == 'optimizer':
-    optimizer_params = stepper_config.pop('optimizer_params', {})
-    optimizer_params.update(stepper_config)
-    # Remove params from other steppers with nested configs, if present.
-    optimizer_params.pop('newton_raphson_params', None)
-    return nonlinear_theta_method.OptimizerThetaMethodBuilder(
-        runtime_params=config_args.recursive_replace(
-            nonlinear_theta_method.OptimizerRuntimeParams(),
-            **optimizer_params,
-        )
-    )
-  raise ValueError(f'Unknown stepper type: {stepper_type}')
+  if stepper_type not in _STEPPER_TYPES:
+    raise ValueError(f'Unknown stepper type: {stepper_type}')
+  builder_type, runtime_params_type, params_key = _STEPPER_TYPES[stepper_type]
+  # Remove params from steppers with nested configs, keeping only the ones of
+  # the chosen stepper, if present. Top-level params take precedence.
+  stepper_params = {}
+  for key in _NESTED_STEPPER_PARAMS_KEYS:
+    nested_params = stepper_config.pop(key, None)
+    if key == params_key and nested_params:
+      stepper_params.update(nested_params)
+  stepper_params.update(stepper_config)
+  return builder_type(
+      runtime_params=config_args.recursive_replace(
+          runtime_params_type(),
+          **stepper_params,
+      )
+  )
 
 
 def build_time_step_calculator_from_config(
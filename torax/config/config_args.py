@@ -18,12 +18,15 @@ from __future__ import annotations
 
 import dataclasses
 import enum
+import functools
 import types
 import typing
 from typing import Any
+from typing import Callable
 from typing import TypeVar
 
 import chex
+import jax
 from jax import numpy as jnp
 from torax import geometry
 from torax import interpolated_param
@@ -84,31 +87,97 @@ def input_is_an_interpolated_var_1d(
     return _check(field_type)
 
 
-def interpolate_var_1d(
-    param_or_param_input: interpolated_param.TimeInterpolatedScalar,
-    t: chex.Numeric,
-) -> jnp.ndarray:
-  """Interpolates the input param at time t."""
-  if not isinstance(param_or_param_input, interpolated_param.InterpolatedVar1d):
-    # The param is a InterpolatedVar1dInput, so we need to convert it to an
-    # InterpolatedVar1d first.
-    if isinstance(param_or_param_input, tuple):
-      if len(param_or_param_input) != 2:
+class _HashableInput:
+  """Wraps a raw interpolated param input so that it can be used as a key.
+
+  Raw inputs are floats, bools, (nested) dicts of those, or (values, mode)
+  tuples. They are compared by value, so an input which is updated in place
+  maps to a new key.
+  """
+
+  def __init__(self, value: Any):
+    self.value = value
+    self._key = _freeze(value)
+    self._hash = hash(self._key)
+
+  def __hash__(self) -> int:
+    return self._hash
+
+  def __eq__(self, other: Any) -> bool:
+    return isinstance(other, _HashableInput) and self._key == other._key
+
+
+def _freeze(value: Any) -> Any:
+  """Converts a raw interpolated param input into a hashable key."""
+  if isinstance(value, dict):
+    return (dict,) + tuple((k, _freeze(v)) for k, v in value.items())
+  if isinstance(value, tuple):
+    return (tuple,) + tuple(_freeze(v) for v in value)
+  # Keep the type so that, e.g., True and 1.0 map to different keys.
+  return (type(value), value)
+
+
+def _make_interpolated_var_1d(
+    value: interpolated_param.InterpolatedVar1dInput,
+) -> interpolated_param.InterpolatedVar1d:
+  """Builds (and validates) an InterpolatedVar1d from a raw input."""
+  # Inputs are Python constants, so make sure the built param holds concrete
+  # arrays even when first requested from inside a jitted function.
+  with jax.ensure_compile_time_eval():
+    if isinstance(value, tuple):
+      if len(value) != 2:
         raise ValueError(
             '1D interpolated var tuple length must be 2. The first element are'
             ' the values and the second element is the interpolation mode.'
-            f' Given: {param_or_param_input}.'
+            f' Given: {value}.'
         )
-      param_or_param_input = interpolated_param.InterpolatedVar1d(
-          value=param_or_param_input[0],
+      return interpolated_param.InterpolatedVar1d(
+          value=value[0],
           interpolation_mode=interpolated_param.InterpolationMode[
-              param_or_param_input[1].upper()
+              value[1].upper()
           ],
       )
-    else:
-      param_or_param_input = interpolated_param.InterpolatedVar1d(
-          value=param_or_param_input,
-      )
+    return interpolated_param.InterpolatedVar1d(value=value)
+
+
+def _make_interpolated_var_2d(
+    values: interpolated_param.InterpolatedVar2dInput,
+) -> interpolated_param.InterpolatedVar2d:
+  """Builds (and validates) an InterpolatedVar2d from a raw input."""
+  with jax.ensure_compile_time_eval():
+    return interpolated_param.InterpolatedVar2d(values=values)
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_make(
+    make_fn: Callable[[Any], Any], param_input: _HashableInput
+) -> Any:
+  return make_fn(param_input.value)
+
+
+def _make_cached(make_fn: Callable[[Any], Any], value: Any) -> Any:
+  """Calls make_fn(value), reusing the result for equal raw inputs."""
+  try:
+    param_input = _HashableInput(value)
+  except TypeError:
+    # Unhashable input (e.g. containing arrays), so build without caching.
+    return make_fn(value)
+  return _cached_make(make_fn, param_input)
+
+
+def interpolate_var_1d(
+    param_or_param_input: interpolated_param.TimeInterpolatedScalar,
+    t: chex.Numeric,
+) -> jnp.ndarray:
+  """Interpolates the input param at time t."""
+  if not isinstance(param_or_param_input, interpolated_param.InterpolatedVar1d):
+    # The param is a InterpolatedVar1dInput, so we need to convert it to an
+    # InterpolatedVar1d first. The converted param is cached, so the
+    # conversion and validation only happen once per distinct input rather
+    # than on every time step.
+    param_or_param_input = _make_cached(
+        _make_interpolated_var_1d, param_or_param_input
+    )
   return param_or_param_input.get_value(t)
 
 
@@ -157,13 +226,143 @@ def interpolate_var_2d(
 ) -> jnp.ndarray:
   """Interpolates the input param at time t and rho_norm for the current geo."""
   if not isinstance(param_or_param_input, interpolated_param.InterpolatedVar2d):
-    # Dealing with a param input so convert it first.
-    param_or_param_input = interpolated_param.InterpolatedVar2d(
-        values=param_or_param_input,
+    # Dealing with a param input so convert it first (cached, as above).
+    param_or_param_input = _make_cached(
+        _make_interpolated_var_2d, param_or_param_input
     )
+  # Always pass the mesh's own face_centers array (rather than a converted
+  # copy): the same array object is shared by every 2D param and every step
+  # for a given geometry, which lets InterpolatedVar2d reuse its table of
+  # values on that grid without re-keying it.
   return param_or_param_input.get_value(t, geo.mesh.face_centers)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_fields_to_types(config_type: type[Any]) -> dict[str, Any]:
+  """Returns a (cached) mapping from field name to type for a dataclass.
+
+  The returned dict is shared between callers and must not be mutated.
+  """
+  return {field.name: field.type for field in dataclasses.fields(config_type)}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_enum_fields(config_type: type[Any]) -> dict[str, type[enum.Enum]]:
+  """Returns a (cached) mapping from field name to type for enum fields.
+
+  The returned dict is shared between callers and must not be mutated.
+  """
+  enum_fields = {}
+  for name, field_type in _get_fields_to_types(config_type).items():
+    try:
+      if issubclass(field_type, enum.Enum):
+        enum_fields[name] = field_type
+    except TypeError:
+      # Ignore these errors. issubclass doesn't work with typing.Optional
+      # types. Note that this means that optional enum fields might not be
+      # cast properly, so avoid these when defining configs.
+      pass
+  return enum_fields
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_names(
+    config_type: type[Any], skip: tuple[str, ...] = ()
+) -> tuple[str, ...]:
+  """Returns the (cached) names of the fields of a dataclass not in skip."""
+  return tuple(
+      field.name
+      for field in dataclasses.fields(config_type)
+      if field.name not in skip
+  )
+
+
+@functools.lru_cache(maxsize=None)
+def _has_interpolated_fields(config_type: type[Any]) -> bool:
+  """Returns True if any field of the dataclass is interpolated in time."""
+  fields_to_types = _get_fields_to_types(config_type)
+  return any(
+      input_is_an_interpolated_var_1d(field_name, fields_to_types)
+      or input_is_an_interpolated_var_2d(field_name, fields_to_types)
+      for field_name in fields_to_types
+  )
+
+
+def is_time_independent(input_config: ...) -> bool:
+  """Returns True if building dynamic params from the config ignores t.
+
+  This is the case when none of its fields are interpolated in time and none
+  of them are nested configs which build their own dynamic params.
+
+  Args:
+    input_config: Dataclass instance of runtime params.
+  """
+  if _has_interpolated_fields(type(input_config)):
+    return False
+  return not any(
+      _builds_dynamic_params(type(getattr(input_config, field_name)))
+      for field_name in _get_fields_to_types(type(input_config))
+  )
+
+
+@functools.lru_cache(maxsize=None)
+def _builds_dynamic_params(value_type: type[Any]) -> bool:
+  """Returns True if values of this type are nested runtime params configs."""
+  return hasattr(value_type, 'build_dynamic_params')
+
+
+@enum.unique
+class _FieldKind(enum.Enum):
+  """How get_init_kwargs converts an input config field."""
+
+  INTERPOLATED_VAR_1D = 'interpolated_var_1d'
+  INTERPOLATED_VAR_2D = 'interpolated_var_2d'
+  FLOAT = 'float'
+  OTHER = 'other'
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_kinds(
+    input_type: type[Any],
+    output_type: type[Any],
+    skip: tuple[str, ...],
+) -> tuple[tuple[str, _FieldKind, bool], ...]:
+  """Returns the (cached) kind of each output field, based on its input type.
+
+  The kinds only depend on the types, so they are worked out once rather than
+  re-checking the type annotations of every field on every call.
+
+  Args:
+    input_type: Dataclass type of the input config.
+    output_type: Dataclass type the kwargs are built for.
+    skip: Names of the output fields to leave out.
+
+  Returns:
+    Tuple of (field name, kind, whether it is a field of the input type) for
+    each output field not in skip.
+  """
+  input_config_fields_to_types = _get_fields_to_types(input_type)
+  field_kinds = []
+  for field_name in _get_field_names(output_type, skip):
+    is_input_field = field_name in input_config_fields_to_types
+    # dataclass fields can either be the actual type OR the string name of the
+    # type. The input_is_* functions check for both.
+    if input_is_an_interpolated_var_1d(
+        field_name, input_config_fields_to_types
+    ):
+      kind = _FieldKind.INTERPOLATED_VAR_1D
+    elif input_is_an_interpolated_var_2d(
+        field_name, input_config_fields_to_types
+    ):
+      kind = _FieldKind.INTERPOLATED_VAR_2D
+    elif input_is_a_float_field(field_name, input_config_fields_to_types):
+      kind = _FieldKind.FLOAT
+    else:
+      kind = _FieldKind.OTHER
+    field_kinds.append((field_name, kind, is_input_field))
+  return tuple(field_kinds)
+
+
 def get_init_kwargs(
     input_config: ...,
     output_type: ...,
@@ -173,42 +372,35 @@ def get_init_kwargs(
 ) -> dict[str, Any]:
   """Builds init() kwargs based on the input config for all non-dict fields."""
   kwargs = {}
-  input_config_fields_to_types = {
-      field.name: field.type for field in dataclasses.fields(input_config)
-  }
-  for field in dataclasses.fields(output_type):
-    if field.name in skip:
-      continue
-    if not hasattr(input_config, field.name):
-      raise ValueError(f'Missing field {field.name}')
-    config_val = getattr(input_config, field.name)
+  for field_name, kind, is_input_field in _get_field_kinds(
+      type(input_config), output_type, tuple(skip)
+  ):
+    # Fields of the input type are always set, so only other names need the
+    # (comparatively slow) hasattr check.
+    if not is_input_field and not hasattr(input_config, field_name):
+      raise ValueError(f'Missing field {field_name}')
+    config_val = getattr(input_config, field_name)
     # If the input config type is an InterpolatedVar1d, we need to interpolate
     # it at time t to populate the correct values in the output config.
-    # dataclass fields can either be the actual type OR the string name of the
-    # type. Check for both.
-    if input_is_an_interpolated_var_1d(
-        field.name, input_config_fields_to_types
-    ):
+    if kind is _FieldKind.INTERPOLATED_VAR_1D:
       if t is None:
         raise ValueError('t must be specified for interpolated params')
       if config_val is not None:
         config_val = interpolate_var_1d(config_val, t)
-    elif input_is_an_interpolated_var_2d(
-        field.name, input_config_fields_to_types
-    ):
+    elif kind is _FieldKind.INTERPOLATED_VAR_2D:
       if config_val is not None:
         if t is None:
           raise ValueError('t must be specified for interpolated params')
         if geo is None:
           raise ValueError('geo must be specified for interpolated params')
         config_val = interpolate_var_2d(config_val, t, geo)
-    elif input_is_a_float_field(field.name, input_config_fields_to_types):
+    elif kind is _FieldKind.FLOAT:
       config_val = float(config_val)
     elif isinstance(config_val, enum.Enum):
       config_val = config_val.value
-    elif hasattr(config_val, 'build_dynamic_params'):
+    elif _builds_dynamic_params(type(config_val)):
       config_val = config_val.build_dynamic_params(t)
-    kwargs[field.name] = config_val
+    kwargs[field_name] = config_val
   return kwargs
 
 
@@ -228,17 +420,18 @@ def recursive_replace(
     **changes: Dict of updates to apply to fields of `obj`.
 
   Returns:
-    A copy of `obj` with the changes applied.
+    A copy of `obj` with the changes applied. If `obj` is a frozen dataclass and
+    none of its fields change, `obj` itself is returned.
   """
 
   flattened_changes = {}
   if dataclasses.is_dataclass(obj):
-    keys_to_types = {
-        field.name: field.type for field in dataclasses.fields(obj)
-    }
+    keys_to_types = _get_fields_to_types(type(obj))
+    enum_fields = _get_enum_fields(type(obj))
   else:
     # obj is another dict-like object that does not have typed fields.
     keys_to_types = None
+    enum_fields = {}
   for key, value in changes.items():
     if (
         ignore_extra_kwargs
@@ -282,26 +475,25 @@ def recursive_replace(
     else:
       # For any value that should be an enum value but is not an enum already
       # (could come a YAML file for instance and might be a string or int),
-      # this converts that value to an enum.
-      try:
-        if (
-            # if obj is a dataclass
-            keys_to_types is not None
-            and
-            # and this param should be an enum
-            issubclass(keys_to_types[key], enum.Enum)
-            and
-            # but it is not already one.
-            not isinstance(value, enum.Enum)
-        ):
-          if isinstance(value, str):
-            value = keys_to_types[key][value.upper()]
-          else:
-            value = keys_to_types[key](value)
-      except TypeError:
-        # Ignore these errors. issubclass doesn't work with typing.Optional
-        # types. Note that this means that optional enum fields might not be
-        # cast properly, so avoid these when defining configs.
-        pass
+      # this converts that value to an enum. Which fields are enums is worked
+      # out once per dataclass type.
+      if keys_to_types is not None and key not in keys_to_types:
+        raise KeyError(key)
+      enum_type = enum_fields.get(key)
+      if enum_type is not None and not isinstance(value, enum.Enum):
+        if isinstance(value, str):
+          value = enum_type[value.upper()]
+        else:
+          value = enum_type(value)
       flattened_changes[key] = value
+  if _is_frozen_dataclass(obj) and all(
+      value is getattr(obj, key) for key, value in flattened_changes.items()
+  ):
+    # Nothing actually changes, and since obj cannot be mutated it is safe to
+    # return it as is rather than constructing (and re-validating) a copy.
+    return obj
   return dataclasses.replace(obj, **flattened_changes)
+
+
+def _is_frozen_dataclass(obj: Any) -> bool:
+  return dataclasses.is_dataclass(obj) and obj.__dataclass_params__.frozen
@@ -37,11 +37,20 @@ used.
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import Callable
+import collections
+from collections.abc import Hashable, Mapping, Sequence
+import dataclasses
+import enum
+import functools
+import operator
+from typing import Any, Callable
 
 import chex
+import jax
+from jax import numpy as jnp
+import numpy as np
 from torax import geometry
+from torax import jax_utils
 from torax.config import config_args
 from torax.config import runtime_params as general_runtime_params
 from torax.sources import runtime_params as sources_params
@@ -82,6 +91,13 @@ class DynamicRuntimeParamsSlice:
 
   This class packages all these together for convenience, as it simplifies many
   of the internal APIs within TORAX.
+
+  The nested structure is kept on purpose: the sub-params are plain frozen chex
+  dataclasses of arrays (there are no nested config models to walk), and each
+  component reads only the sub-params it owns. The slice is flattened once per
+  call into a jitted function, and the provider hands back the same cached
+  slice object for repeated calls at the same time, so the cost of flattening
+  it scales with its number of leaves, not its depth.
   """
 
   transport: transport_model_params.DynamicRuntimeParams
@@ -262,17 +278,52 @@ def build_dynamic_runtime_params_slice(
     geo: geometry.Geometry | None = None,
 ) -> DynamicRuntimeParamsSlice:
   """Builds a DynamicRuntimeParamsSlice."""
-  transport = transport or transport_model_params.RuntimeParams()
   sources = sources or {}
   stepper = stepper or stepper_params.RuntimeParams()
   t = runtime_params.numerics.t_initial if t is None else t
+  return _build_dynamic_runtime_params_slice(
+      runtime_params=runtime_params,
+      transport=transport,
+      dynamic_sources=_build_dynamic_sources(sources, t),
+      dynamic_stepper=stepper.build_dynamic_params(t),
+      t=t,
+      geo=geo,
+  )
+
+
+def _build_dynamic_runtime_params_slice(
+    runtime_params: general_runtime_params.GeneralRuntimeParams,
+    transport: transport_model_params.RuntimeParams | None,
+    dynamic_sources: dict[str, sources_params.DynamicRuntimeParams],
+    dynamic_stepper: stepper_params.DynamicRuntimeParams | None,
+    t: chex.Numeric,
+    geo: geometry.Geometry | None,
+) -> DynamicRuntimeParamsSlice:
+  """Builds a DynamicRuntimeParamsSlice from already built sub-params.
+
+  The sub-params are constructed from kwargs dicts, which is comparatively slow
+  Python. DynamicRuntimeParamsSliceProvider calls this from inside a jitted
+  function, so that cost is only paid when tracing, not on every step.
+
+  Args:
+    runtime_params: General runtime params.
+    transport: Transport model runtime params. Uses the defaults if None.
+    dynamic_sources: Already built dynamic params of each source.
+    dynamic_stepper: Already built dynamic stepper params.
+    t: Time to build the dynamic params at.
+    geo: Geometry to interpolate profiles onto.
+
+  Returns:
+    The DynamicRuntimeParamsSlice at time t.
+  """
+  transport = transport or transport_model_params.RuntimeParams()
   # For each dataclass attribute under DynamicRuntimeParamsSlice, build those
   # objects explicitly, and then for all scalar attributes, fetch their values
   # directly from the input runtime params using config_args.get_init_kwargs.
   return DynamicRuntimeParamsSlice(
       transport=transport.build_dynamic_params(t),
-      stepper=stepper.build_dynamic_params(t),
-      sources=_build_dynamic_sources(sources, t),
+      stepper=dynamic_stepper,
+      sources=dynamic_sources,
       plasma_composition=DynamicPlasmaComposition(
           **config_args.get_init_kwargs(
               input_config=runtime_params.plasma_composition,
@@ -315,7 +366,21 @@ def _build_dynamic_sources(
     sources: dict[str, sources_params.RuntimeParams],
     t: chex.Numeric,
 ) -> dict[str, sources_params.DynamicRuntimeParams]:
-  """Builds a dict of DynamicSourceConfigSlice based on the input config."""
+  """Builds a dict of DynamicSourceConfigSlice based on the input config.
+
+  The params are deliberately kept as one struct per source rather than stacked
+  into arrays with a leading source axis: each source type has its own params
+  class (and formula params), and sources look up their params by name. The
+  per-source Python overhead is instead removed by building all of them in a
+  single jitted call, see DynamicRuntimeParamsSliceProvider.
+
+  Args:
+    sources: Runtime params for each source, keyed by source name.
+    t: Time to build the dynamic params at.
+
+  Returns:
+    Dynamic params for each source, keyed by source name.
+  """
   return {
       source_name: input_source_config.build_dynamic_params(t)
       for source_name, input_source_config in sources.items()
@@ -340,6 +405,7 @@ def build_static_runtime_params_slice(
   )
 
 
+@jax.tree_util.register_pytree_node_class
 class DynamicRuntimeParamsSliceProvider:
   """Provides a DynamicRuntimeParamsSlice to use during time t of the sim.
 
@@ -347,6 +413,21 @@ class DynamicRuntimeParamsSliceProvider:
   class interpolates any time-dependent params in the input config to the values
   they should be at time t.
 
+  Within a single simulation step, the same time t is requested several times
+  (e.g. at the end of one step and at the start of the next), so the built
+  slices are cached per concrete time value and geometry. The cache key also
+  includes a snapshot of the input runtime params, so in-place updates to them
+  are picked up on the next call. Calls with a traced t bypass the cache.
+
+  The stepper params are usually not interpolated in time, in which case their
+  dynamic params are built once and shared by all slices. The dynamic params
+  of all sources are built together by a single jitted function, rather than
+  dispatching the interpolation ops of each source separately. Likewise, when
+  caching is enabled, all of the general and transport params are interpolated
+  by a single jitted function of t and the geometry, which is rebuilt whenever
+  the runtime params change. The params which are not interpolated keep their
+  Python values, rather than becoming device arrays.
+
   See `run_simulation()` for how this callable is used.
   """
 
@@ -356,11 +437,31 @@ class DynamicRuntimeParamsSliceProvider:
       transport_getter: Callable[[], transport_model_params.RuntimeParams],
       sources_getter: Callable[[], dict[str, sources_params.RuntimeParams]],
       stepper_getter: Callable[[], stepper_params.RuntimeParams],
+      cache_size: int = 64,
   ):
     self._runtime_params = runtime_params
     self._transport_runtime_params_getter = transport_getter
     self._sources_getter = sources_getter
     self._stepper_getter = stepper_getter
+    self._cache_size = cache_size
+    self._cache: collections.OrderedDict[
+        Hashable, tuple[geometry.Geometry | None, DynamicRuntimeParamsSlice]
+    ] = collections.OrderedDict()
+    self._dynamic_stepper: (
+        tuple[Hashable, stepper_params.DynamicRuntimeParams] | None
+    ) = None
+    self._sources_builder: (
+        tuple[
+            Hashable,
+            Callable[
+                [chex.Numeric], dict[str, sources_params.DynamicRuntimeParams]
+            ],
+        ]
+        | None
+    ) = None
+    self._slice_builder: (
+        tuple[Hashable, Callable[..., DynamicRuntimeParamsSlice]] | None
+    ) = None
 
   def __call__(
       self,
@@ -368,11 +469,384 @@ class DynamicRuntimeParamsSliceProvider:
       geo: geometry.Geometry | None = None,
   ) -> DynamicRuntimeParamsSlice:
     """Returns a DynamicRuntimeParamsSlice to use during time t of the sim."""
-    return build_dynamic_runtime_params_slice(
-        runtime_params=self._runtime_params,
-        transport=self._transport_runtime_params_getter(),
-        sources=self._sources_getter(),
-        stepper=self._stepper_getter(),
-        t=t,
-        geo=geo,
+    transport = self._transport_runtime_params_getter()
+    sources = self._sources_getter()
+    stepper = self._stepper_getter()
+    sources_snapshot = _snapshot(sources)
+    stepper_snapshot = _snapshot(stepper)
+    dynamic_stepper = self._get_dynamic_stepper(stepper, stepper_snapshot, t)
+    if self._cache_size <= 0 or isinstance(t, jax.core.Tracer):
+      return _build_dynamic_runtime_params_slice(
+          runtime_params=self._runtime_params,
+          transport=transport,
+          dynamic_sources=self._build_dynamic_sources(
+              sources, sources_snapshot, t
+          ),
+          dynamic_stepper=dynamic_stepper,
+          t=t,
+          geo=geo,
+      )
+    runtime_params_snapshot = _snapshot(self._runtime_params)
+    transport_snapshot = _snapshot(transport)
+    key = (
+        float(t),
+        id(geo),
+        runtime_params_snapshot,
+        transport_snapshot,
+        sources_snapshot,
+        stepper_snapshot,
+    )
+    cached = self._cache.get(key)
+    if cached is not None and cached[0] is geo:
+      self._cache.move_to_end(key)
+      return cached[1]
+    slice_builder = self._get_slice_builder(
+        transport, (runtime_params_snapshot, transport_snapshot)
+    )
+    dynamic_runtime_params_slice = dataclasses.replace(
+        slice_builder(t=t, geo=geo),
+        sources=self._build_dynamic_sources(sources, sources_snapshot, t),
+        stepper=dynamic_stepper,
+    )
+    # Slices built while tracing (e.g. when the provider is called from
+    # inside a jitted function) hold tracers and must not outlive the trace.
+    if any(
+        isinstance(leaf, jax.core.Tracer)
+        for leaf in jax.tree_util.tree_leaves(dynamic_runtime_params_slice)
+    ):
+      return dynamic_runtime_params_slice
+    self._cache[key] = (geo, dynamic_runtime_params_slice)
+    if len(self._cache) > self._cache_size:
+      self._cache.popitem(last=False)
+    return dynamic_runtime_params_slice
+
+  def batch(
+      self,
+      ts: chex.Array,
+      geo: geometry.Geometry | None = None,
+  ) -> DynamicRuntimeParamsSlice:
+    """Returns the slices for all times in ts, stacked along a leading axis.
+
+    The slice at each time is built (or taken from the cache) as by a call to
+    this provider, and the slices are then stacked, which is useful e.g. for
+    post-processing a whole simulation. Use
+    `jax.tree_util.tree_map(lambda x: x[i], batched)` to get the slice at
+    `ts[i]`. The slices are not built under jax.vmap, since unflattening them
+    validates their params, which vmap's placeholder leaves cannot pass.
+
+    Args:
+      ts: 1D array of times.
+      geo: Geometry used for all times.
+
+    Returns:
+      A DynamicRuntimeParamsSlice whose leaves have a leading time axis.
+    """
+    return stack_dynamic_runtime_params_slices(
+        [self(t, geo) for t in np.asarray(ts)]
+    )
+
+  def _get_dynamic_stepper(
+      self,
+      stepper: stepper_params.RuntimeParams,
+      stepper_snapshot: Hashable,
+      t: chex.Numeric,
+  ) -> stepper_params.DynamicRuntimeParams:
+    """Returns the stepper dynamic params, built once if they ignore t."""
+    if not config_args.is_time_independent(stepper):
+      return stepper.build_dynamic_params(t)
+    if (
+        self._dynamic_stepper is None
+        or self._dynamic_stepper[0] != stepper_snapshot
+    ):
+      self._dynamic_stepper = (
+          stepper_snapshot,
+          stepper.build_dynamic_params(t),
+      )
+    return self._dynamic_stepper[1]
+
+  def _build_dynamic_sources(
+      self,
+      sources: dict[str, sources_params.RuntimeParams],
+      sources_snapshot: Hashable,
+      t: chex.Numeric,
+  ) -> dict[str, sources_params.DynamicRuntimeParams]:
+    """Builds the dynamic params of all sources in a single jitted call."""
+    if not sources:
+      return {}
+    if (
+        self._sources_builder is None
+        or self._sources_builder[0] != sources_snapshot
+    ):
+      # The sources are closed over, so the builder is only valid for as long
+      # as the sources runtime params are unchanged.
+      self._sources_builder = (
+          sources_snapshot,
+          jax_utils.jit(functools.partial(_build_dynamic_sources, sources)),
+      )
+    return self._sources_builder[1](t)
+
+  def _get_slice_builder(
+      self,
+      transport: transport_model_params.RuntimeParams | None,
+      snapshot: Hashable,
+  ) -> Callable[..., DynamicRuntimeParamsSlice]:
+    """Returns a jitted fn interpolating all general and transport params.
+
+    The sources and stepper params of the returned slice are left empty, as
+    they are built (and cached) separately.
+
+    Args:
+      transport: Transport model runtime params.
+      snapshot: Snapshot of the runtime params the builder is valid for.
+
+    Returns:
+      Function from t and geo (as keyword args) to a DynamicRuntimeParamsSlice.
+    """
+    if self._slice_builder is None or self._slice_builder[0] != snapshot:
+      # Each param otherwise does its own lookup of t and dispatches its own
+      # interpolation ops. The runtime params are closed over, so the builder
+      # is only valid for as long as they are unchanged. The geometry is an
+      # argument, so that a new geometry (e.g. at each time of a time-dependent
+      # geometry) does not need a new builder or a recompile.
+      self._slice_builder = (
+          snapshot,
+          _jit_keeping_python_scalars(
+              functools.partial(
+                  _build_dynamic_runtime_params_slice,
+                  runtime_params=self._runtime_params,
+                  transport=transport,
+                  dynamic_sources={},
+                  dynamic_stepper=None,
+              )
+          ),
+      )
+    return self._slice_builder[1]
+
+  # The provider is used as pytree aux data (see tree_flatten) and can be
+  # passed as a static argument to jitted functions. JAX looks up compiled
+  # functions by the hash and equality of these, so pin both to identity:
+  # the same provider always hits the cache in O(1), and a different provider
+  # always retraces, as it may hold different runtime params.
+  def __hash__(self) -> int:
+    return id(self)
+
+  def __eq__(self, other: Any) -> bool:
+    return self is other
+
+  def clear_cache(self) -> None:
+    """Drops all cached DynamicRuntimeParamsSlices."""
+    self._cache.clear()
+    self._dynamic_stepper = None
+    self._sources_builder = None
+    self._slice_builder = None
+
+  def tree_flatten(self) -> tuple[tuple[()], DynamicRuntimeParamsSliceProvider]:
+    return (), self
+
+  @classmethod
+  def tree_unflatten(
+      cls,
+      aux_data: DynamicRuntimeParamsSliceProvider,
+      children: tuple[()],
+  ) -> DynamicRuntimeParamsSliceProvider:
+    del children  # Unused.
+    return aux_data
+
+
+def build_jitted_slice_and_geometry_fn(
+    dynamic_runtime_params_slice_provider: DynamicRuntimeParamsSliceProvider,
+    geometry_provider: Callable[[chex.Numeric], geometry.Geometry],
+) -> Callable[
+    [chex.Numeric], tuple[DynamicRuntimeParamsSlice, geometry.Geometry]
+]:
+  """Returns a jitted fn mapping t to the slice and geometry at time t.
+
+  Both providers are baked into the function with functools.partial rather than
+  passed as arguments, so all of the Python glue (getters, config lookups,
+  interpolation of each param) is traced once and then runs as a single
+  compiled function per call.
+
+  NOTE: The runtime params are read when the function is traced, so in-place
+  updates to them after the first call are not seen by the returned function.
+  Build a new function after changing the runtime params.
+
+  Args:
+    dynamic_runtime_params_slice_provider: Provides the slice at each time.
+    geometry_provider: Provides the geometry at each time.
+
+  Returns:
+    Jitted function returning the slice and the geometry at time t.
+  """
+  return jax_utils.jit(
+      functools.partial(
+          _get_slice_and_geometry,
+          dynamic_runtime_params_slice_provider=dynamic_runtime_params_slice_provider,
+          geometry_provider=geometry_provider,
+      )
+  )
+
+
+def stack_dynamic_runtime_params_slices(
+    slices: Sequence[DynamicRuntimeParamsSlice],
+) -> DynamicRuntimeParamsSlice:
+  """Stacks slices from several configs along a new leading batch axis.
+
+  This is the input to a parameter sweep which vmaps a function of the slice
+  over the batch axis with vmap_over_slices, so that all of the configs are
+  traced once and run as a single compiled program. The slices must have the
+  same structure, i.e.
+  come from configs which only differ in the values of their params, and which
+  share the same static runtime params and geometry.
+
+  Args:
+    slices: Slices to stack, e.g. built by one provider per config at the same
+      time t.
+
+  Returns:
+    A DynamicRuntimeParamsSlice whose leaves have a leading batch axis, with
+    the leaves of slices[i] at index i.
+  """
+  if not slices:
+    raise ValueError('At least one slice is needed.')
+  return jax.tree_util.tree_map(lambda *xs: jnp.stack(xs), *slices)
+
+
+def vmap_over_slices(
+    fn: Callable[[DynamicRuntimeParamsSlice], Any],
+    stacked_slices: DynamicRuntimeParamsSlice,
+) -> Any:
+  """Maps fn over the leading batch axis of stacked slices with jax.vmap.
+
+  Calling jax.vmap(fn) on the stacked slices directly does not work: vmap
+  unflattens its inputs and outputs with placeholder leaves, and unflattening a
+  slice (or e.g. a CellVariable returned by fn) validates its params, which the
+  placeholders cannot pass. So the leaves are vmapped over instead, and the
+  slices and the outputs are only rebuilt from actual (batched) values.
+
+  Args:
+    fn: Function of a single DynamicRuntimeParamsSlice, returning a pytree.
+    stacked_slices: Slices stacked by stack_dynamic_runtime_params_slices.
+
+  Returns:
+    The outputs of fn for each slice, stacked along a leading batch axis.
+  """
+  leaves, treedef = jax.tree_util.tree_flatten(stacked_slices)
+  out_treedef = None
+
+  def fn_of_leaves(leaves: list[Any]) -> list[Any]:
+    nonlocal out_treedef
+    out_leaves, out_treedef = jax.tree_util.tree_flatten(
+        fn(jax.tree_util.tree_unflatten(treedef, leaves))
+    )
+    return out_leaves
+
+  out_leaves = jax.vmap(fn_of_leaves)(leaves)
+  return jax.tree_util.tree_unflatten(out_treedef, out_leaves)
+
+
+def _jit_keeping_python_scalars(
+    fn: Callable[..., DynamicRuntimeParamsSlice],
+) -> Callable[..., DynamicRuntimeParamsSlice]:
+  """Jits fn, but keeps the leaves of its output which are Python scalars.
+
+  The leaves of a slice which are Python scalars (e.g. bool and int flags) are
+  copied from the runtime params, rather than interpolated, so do not depend on
+  the args. Returning them from a jitted function would turn them into device
+  arrays, which callers branching on them in Python would then need to sync
+  back to the host. So they are taken from a single eager call instead.
+
+  Args:
+    fn: Function building a slice from keyword args.
+
+  Returns:
+    Function with the same signature as fn.
+  """
+  jitted_fn = jax_utils.jit(fn)
+  python_scalars = None
+
+  def wrapped(**kwargs) -> DynamicRuntimeParamsSlice:
+    nonlocal python_scalars
+    if python_scalars is None:
+      python_scalars = [
+          leaf if isinstance(leaf, (bool, int, float)) else None
+          for leaf in jax.tree_util.tree_leaves(fn(**kwargs))
+      ]
+    leaves, treedef = jax.tree_util.tree_flatten(jitted_fn(**kwargs))
+    return jax.tree_util.tree_unflatten(
+        treedef,
+        [
+            leaf if python_scalar is None else python_scalar
+            for leaf, python_scalar in zip(leaves, python_scalars)
+        ],
+    )
+
+  return wrapped
+
+
+def _get_slice_and_geometry(
+    t: chex.Numeric,
+    *,
+    dynamic_runtime_params_slice_provider: DynamicRuntimeParamsSliceProvider,
+    geometry_provider: Callable[[chex.Numeric], geometry.Geometry],
+) -> tuple[DynamicRuntimeParamsSlice, geometry.Geometry]:
+  geo = geometry_provider(t)
+  return dynamic_runtime_params_slice_provider(t, geo), geo
+
+
+def _snapshot(value: Any) -> Hashable:
+  """Returns a hashable snapshot of the (possibly nested) runtime params.
+
+  Dataclasses, mappings and sequences are walked recursively so that in-place
+  updates to the runtime params change the snapshot. Any other objects (e.g.
+  InterpolatedVar1d instances or arrays) are treated as immutable and compared
+  by identity. The snapshot holds references to them, so that their ids cannot
+  be reused by new objects for as long as the snapshot is kept, e.g. as a
+  cache key.
+
+  Args:
+    value: The runtime params, or a nested attribute of them.
+
+  Returns:
+    A hashable value which changes whenever the runtime params change.
+  """
+  if value is None or isinstance(value, (bool, int, float, str, enum.Enum)):
+    return (type(value), value)
+  if dataclasses.is_dataclass(value) and not isinstance(value, type):
+    return (type(value),) + tuple(
+        _snapshot(field_value)
+        for field_value in _get_fields_getter(type(value))(value)
     )
+  if isinstance(value, Mapping):
+    return tuple((key, _snapshot(v)) for key, v in value.items())
+  if isinstance(value, (list, tuple)):
+    return tuple(_snapshot(v) for v in value)
+  return _IdentityKey(value)
+
+
+class _IdentityKey:
+  """Hashable key comparing an object by identity, which keeps it alive."""
+
+  __slots__ = ('value',)
+
+  def __init__(self, value: Any):
+    self.value = value
+
+  def __hash__(self) -> int:
+    return id(self.value)
+
+  def __eq__(self, other: Any) -> bool:
+    return isinstance(other, _IdentityKey) and self.value is other.value
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fields_getter(
+    dataclass_type: type[Any],
+) -> Callable[[Any], tuple[Any, ...]]:
+  """Returns a (cached) fn returning the field values of a dataclass."""
+  field_names = tuple(
+      field.name for field in dataclasses.fields(dataclass_type)
+  )
+  if len(field_names) < 2:
+    # attrgetter only returns a tuple when given several names.
+    return lambda obj: tuple(getattr(obj, name) for name in field_names)
+  return operator.attrgetter(*field_names)
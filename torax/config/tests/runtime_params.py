@@ -92,6 +92,26 @@ class RuntimeParamsTest(parameterized.TestCase):
     self.assertEqual(result.a4.b4.c1, 19)
     self.assertEqual(result.a4.b4.c2, 20)
 
+  def test_recursive_replace_skips_copy_of_unchanged_frozen_dataclass(self):
+    """Tests that unchanged frozen dataclasses are not copied."""
+    instance = FrozenB(b3=FrozenC())
+    # Replacing with the same nested object, or no changes at all, returns the
+    # input itself.
+    self.assertIs(config_args.recursive_replace(instance), instance)
+    self.assertIs(
+        config_args.recursive_replace(instance, b3=instance.b3), instance
+    )
+    self.assertIs(config_args.recursive_replace(instance, b3={}), instance)
+    result = config_args.recursive_replace(instance, b3={"c1": -1})
+    self.assertIsNot(result, instance)
+    self.assertEqual(result.b3.c1, -1)
+    self.assertEqual(result.b1, 3)
+    # Mutable dataclasses are always copied.
+    mutable_instance = C()
+    self.assertIsNot(
+        config_args.recursive_replace(mutable_instance), mutable_instance
+    )
+
   def test_runtime_params_raises_for_invalid_temp_boundary_conditions(self,):
     """Tests that runtime params validate boundary conditions."""
     with self.assertRaises(ValueError):
@@ -132,6 +152,18 @@ class B:
   b4: C = dataclasses.field(default_factory=C)
 
 
+@dataclasses.dataclass(frozen=True)
+class FrozenC:
+  c1: int = 1
+  c2: int = 2
+
+
+@dataclasses.dataclass(frozen=True)
+class FrozenB:
+  b1: int = 3
+  b3: FrozenC = dataclasses.field(default_factory=FrozenC)
+
+
 @dataclasses.dataclass
 class A:
   a1: int = 5
@@ -16,6 +16,7 @@
 
 from absl.testing import absltest
 from absl.testing import parameterized
+import chex
 import jax
 import numpy as np
 from torax import geometry
@@ -74,6 +75,275 @@ class RuntimeParamsSliceTest(parameterized.TestCase):
         dynamic_runtime_params_slice.profile_conditions.Ti_bound_right, 3.0
     )
 
+  def test_provider_caches_slices_per_time(self):
+    """Tests that repeated calls at the same time reuse the built slice."""
+    runtime_params = general_runtime_params.GeneralRuntimeParams(
+        profile_conditions=general_runtime_params.ProfileConditions(
+            Ti_bound_right={0.0: 2.0, 4.0: 4.0},
+        ),
+    )
+    provider = runtime_params_slice_lib.DynamicRuntimeParamsSliceProvider(
+        runtime_params=runtime_params,
+        transport_getter=transport_params_lib.RuntimeParams,
+        sources_getter=lambda: {},
+        stepper_getter=stepper_params_lib.RuntimeParams,
+    )
+    dcs_1 = provider(t=1.0, geo=self._geo)
+    self.assertIs(provider(t=1.0, geo=self._geo), dcs_1)
+    self.assertIsNot(provider(t=2.0, geo=self._geo), dcs_1)
+    # A different geometry should not hit the cache.
+    self.assertIsNot(
+        provider(t=1.0, geo=geometry.build_circular_geometry()), dcs_1
+    )
+    # In-place updates to the runtime params invalidate the cached slice.
+    runtime_params.profile_conditions.Ti_bound_right = 5.0
+    dcs_2 = provider(t=1.0, geo=self._geo)
+    self.assertIsNot(dcs_2, dcs_1)
+    np.testing.assert_allclose(dcs_2.profile_conditions.Ti_bound_right, 5.0)
+
+  def test_provider_cache_is_not_fooled_by_reused_ids(self):
+    """Tests replaced params are reinterpolated even if their id is reused."""
+    runtime_params = general_runtime_params.GeneralRuntimeParams()
+    provider = runtime_params_slice_lib.DynamicRuntimeParamsSliceProvider(
+        runtime_params=runtime_params,
+        transport_getter=transport_params_lib.RuntimeParams,
+        sources_getter=lambda: {},
+        stepper_getter=stepper_params_lib.RuntimeParams,
+    )
+    for value in range(1, 5):
+      # The previous param is only referenced by the runtime params, so would
+      # be freed here, and its id could be reused by the new param.
+      runtime_params.profile_conditions.Ti_bound_right = (
+          general_runtime_params.InterpolatedVar1d(float(value))
+      )
+      np.testing.assert_allclose(
+          provider(t=1.0, geo=self._geo).profile_conditions.Ti_bound_right,
+          value,
+      )
+
+  def test_provider_builds_time_independent_stepper_params_once(self):
+    """Tests that stepper params which ignore t are shared between slices."""
+    stepper = stepper_params_lib.RuntimeParams()
+    provider = runtime_params_slice_lib.DynamicRuntimeParamsSliceProvider(
+        runtime_params=general_runtime_params.GeneralRuntimeParams(),
+        transport_getter=transport_params_lib.RuntimeParams,
+        sources_getter=lambda: {},
+        stepper_getter=lambda: stepper,
+    )
+    dcs_1 = provider(t=1.0, geo=self._geo)
+    dcs_2 = provider(t=2.0, geo=self._geo)
+    self.assertIs(dcs_1.stepper, dcs_2.stepper)
+    stepper.chi_per = 30.0
+    dcs_3 = provider(t=3.0, geo=self._geo)
+    np.testing.assert_allclose(dcs_3.stepper.chi_per, 30.0)
+
+  def test_provider_builds_same_sources_as_unfused_build(self):
+    """Tests the jitted sources builder against building each source."""
+    sources = {
+        'gas_puff_source': sources_params_lib.RuntimeParams(
+            formula=formula_config.Gaussian(
+                total={0.0: 0.0, 1.0: 1.0},
+                c1={0.0: 0.0, 1.0: 2.0},
+            )
+        ),
+        'jext': external_current_source.RuntimeParams(
+            wext={0.0: 1.0, 1.0: 3.0}
+        ),
+    }
+    runtime_params = general_runtime_params.GeneralRuntimeParams()
+    provider = runtime_params_slice_lib.DynamicRuntimeParamsSliceProvider(
+        runtime_params=runtime_params,
+        transport_getter=transport_params_lib.RuntimeParams,
+        sources_getter=lambda: sources,
+        stepper_getter=stepper_params_lib.RuntimeParams,
+    )
+    for t in (0.0, 0.5, 1.0):
+      expected = runtime_params_slice_lib.build_dynamic_runtime_params_slice(
+          runtime_params, sources=sources, t=t, geo=self._geo
+      ).sources
+      chex.assert_trees_all_close(
+          provider(t=t, geo=self._geo).sources, expected
+      )
+    # Updating the sources in place rebuilds the jitted builder.
+    sources['jext'].wext = 5.0
+    np.testing.assert_allclose(
+        provider(t=0.5, geo=self._geo).sources['jext'].wext, 5.0
+    )
+
+  def test_provider_builds_same_slice_as_unfused_build(self):
+    """Tests the jitted slice builder against building each param."""
+    runtime_params = general_runtime_params.GeneralRuntimeParams(
+        profile_conditions=general_runtime_params.ProfileConditions(
+            Ti_bound_right={0.0: 1.0, 1.0: 3.0},
+            Te={0.0: {0.0: 2.0, 1.0: 1.0}, 1.0: {0.0: 4.0, 1.0: 2.0}},
+        ),
+    )
+    provider = runtime_params_slice_lib.DynamicRuntimeParamsSliceProvider(
+        runtime_params=runtime_params,
+        transport_getter=transport_params_lib.RuntimeParams,
+        sources_getter=lambda: {},
+        stepper_getter=stepper_params_lib.RuntimeParams,
+    )
+    for geo in (self._geo, geometry.build_circular_geometry(Rmaj=5.0)):
+      for t in (0.0, 0.5, 1.0):
+        chex.assert_trees_all_close(
+            provider(t=t, geo=geo),
+            runtime_params_slice_lib.build_dynamic_runtime_params_slice(
+                runtime_params, t=t, geo=geo
+            ),
+        )
+    # Params which are not interpolated keep their Python values.
+    dynamic_slice = provider(t=0.5, geo=self._geo)
+    self.assertIs(
+        dynamic_slice.numerics.enable_prescribed_profile_evolution, True
+    )
+    self.assertIs(dynamic_slice.profile_conditions.normalize_to_nbar, True)
+
+  def test_updated_interpolated_inputs_are_reinterpolated(self):
+    """Tests that in-place updates to raw interpolated inputs are picked up."""
+    Ti_bound_right = {0.0: 2.0, 4.0: 4.0}  # pylint: disable=invalid-name
+    runtime_params = general_runtime_params.GeneralRuntimeParams(
+        profile_conditions=general_runtime_params.ProfileConditions(
+            Ti_bound_right=Ti_bound_right,
+        ),
+    )
+    dcs = runtime_params_slice_lib.build_dynamic_runtime_params_slice(
+        runtime_params, t=2.0, geo=self._geo
+    )
+    np.testing.assert_allclose(dcs.profile_conditions.Ti_bound_right, 3.0)
+    Ti_bound_right[4.0] = 6.0
+    dcs = runtime_params_slice_lib.build_dynamic_runtime_params_slice(
+        runtime_params, t=2.0, geo=self._geo
+    )
+    np.testing.assert_allclose(dcs.profile_conditions.Ti_bound_right, 4.0)
+
+  def test_provider_can_be_input_to_jitted_function(self):
+    """Tests that the provider is a pytree with no array leaves."""
+    provider = runtime_params_slice_lib.DynamicRuntimeParamsSliceProvider(
+        runtime_params=general_runtime_params.GeneralRuntimeParams(),
+        transport_getter=transport_params_lib.RuntimeParams,
+        sources_getter=lambda: {},
+        stepper_getter=stepper_params_lib.RuntimeParams,
+    )
+    self.assertEmpty(jax.tree_util.tree_leaves(provider))
+    num_traces = 0
+
+    @jax.jit
+    def f(provider, x):
+      nonlocal num_traces
+      num_traces += 1
+      return x * provider(t=0.0, geo=self._geo).numerics.t_final
+
+    np.testing.assert_allclose(f(provider, 1.0), 5.0)
+    np.testing.assert_allclose(f(provider, 2.0), 10.0)
+    self.assertEqual(num_traces, 1)
+
+  def test_jitted_slice_and_geometry_fn_matches_providers(self):
+    """Tests the jitted fn returns what the providers return."""
+    runtime_params = general_runtime_params.GeneralRuntimeParams(
+        profile_conditions=general_runtime_params.ProfileConditions(
+            Ti_bound_right={0.0: 1.0, 2.0: 3.0},
+        ),
+    )
+    provider = runtime_params_slice_lib.DynamicRuntimeParamsSliceProvider(
+        runtime_params=runtime_params,
+        transport_getter=transport_params_lib.RuntimeParams,
+        sources_getter=lambda: {},
+        stepper_getter=stepper_params_lib.RuntimeParams,
+    )
+    geometry_provider = lambda t: self._geo
+    jitted_fn = runtime_params_slice_lib.build_jitted_slice_and_geometry_fn(
+        provider, geometry_provider
+    )
+    for t in (0.0, 1.0, 2.0):
+      dynamic_slice, geo = jitted_fn(t)
+      chex.assert_trees_all_close(dynamic_slice, provider(t, self._geo))
+      np.testing.assert_allclose(geo.r_norm, self._geo.r_norm)
+
+  def test_batched_slices_match_slices_at_each_time(self):
+    """Tests batch() stacks the slices built for each time."""
+    runtime_params = general_runtime_params.GeneralRuntimeParams(
+        profile_conditions=general_runtime_params.ProfileConditions(
+            Ti_bound_right={0.0: 1.0, 2.0: 3.0},
+        ),
+    )
+    provider = runtime_params_slice_lib.DynamicRuntimeParamsSliceProvider(
+        runtime_params=runtime_params,
+        transport_getter=transport_params_lib.RuntimeParams,
+        sources_getter=lambda: {},
+        stepper_getter=stepper_params_lib.RuntimeParams,
+    )
+    ts = np.array([0.0, 0.5, 2.0])
+    batched = provider.batch(ts, self._geo)
+    np.testing.assert_allclose(
+        batched.profile_conditions.Ti_bound_right, [1.0, 1.5, 3.0]
+    )
+    for i, t in enumerate(ts):
+      chex.assert_trees_all_close(
+          jax.tree_util.tree_map(lambda x, i=i: x[i], batched),
+          provider(t, self._geo),
+      )
+
+  def test_stacked_slices_batch_several_configs(self):
+    """Tests slices of configs differing only in values can be vmapped."""
+    slices = []
+    for nbar in (0.8, 0.9):
+      runtime_params = general_runtime_params.GeneralRuntimeParams(
+          profile_conditions=general_runtime_params.ProfileConditions(
+              nbar=nbar,
+          ),
+      )
+      slices.append(
+          runtime_params_slice_lib.build_dynamic_runtime_params_slice(
+              runtime_params, t=0.0, geo=self._geo
+          )
+      )
+    stacked = runtime_params_slice_lib.stack_dynamic_runtime_params_slices(
+        slices
+    )
+    np.testing.assert_allclose(
+        runtime_params_slice_lib.vmap_over_slices(
+            lambda s: s.profile_conditions.nbar * 2, stacked
+        ),
+        [1.6, 1.8],
+    )
+    # Outputs which are validated when unflattened, like the slice itself,
+    # are also supported.
+    chex.assert_trees_all_close(
+        runtime_params_slice_lib.vmap_over_slices(lambda s: s, stacked),
+        stacked,
+    )
+    for i, dynamic_slice in enumerate(slices):
+      chex.assert_trees_all_equal(
+          jax.tree_util.tree_map(lambda x, i=i: x[i], stacked), dynamic_slice
+      )
+
+  def test_provider_as_static_arg_is_compared_by_identity(self):
+    """Tests jit cache hits and misses for a static provider argument."""
+    make_provider = lambda: (
+        runtime_params_slice_lib.DynamicRuntimeParamsSliceProvider(
+            runtime_params=general_runtime_params.GeneralRuntimeParams(),
+            transport_getter=transport_params_lib.RuntimeParams,
+            sources_getter=lambda: {},
+            stepper_getter=stepper_params_lib.RuntimeParams,
+        )
+    )
+    provider = make_provider()
+    num_traces = 0
+
+    def f(provider, x):
+      nonlocal num_traces
+      num_traces += 1
+      return x * provider(t=0.0, geo=self._geo).numerics.t_final
+
+    f = jax.jit(f, static_argnames='provider')
+    f(provider=provider, x=1.0)
+    f(provider=provider, x=2.0)
+    self.assertEqual(num_traces, 1)
+    # An equivalent but distinct provider is a different static argument.
+    f(provider=make_provider(), x=1.0)
+    self.assertEqual(num_traces, 2)
+
   def test_boundary_conditions_are_time_dependent(self):
     """Tests that the boundary conditions are time dependent params."""
     # All of the following parameters are time-dependent fields, but they can
@@ -283,6 +553,16 @@ class RuntimeParamsSliceTest(parameterized.TestCase):
     with self.assertRaises(jax.interpreters.xla.xe.XlaRuntimeError):
       dcs_provider(t=1.0, geo=self._geo,)
 
+  def test_stepper_static_params_are_reused_until_changed(self):
+    """Tests that the stepper static params are only rebuilt on change."""
+    stepper_params = stepper_params_lib.RuntimeParams()
+    static_params = stepper_params.build_static_params()
+    self.assertIs(stepper_params.build_static_params(), static_params)
+    stepper_params.theta_imp = 0.5
+    new_static_params = stepper_params.build_static_params()
+    self.assertIsNot(new_static_params, static_params)
+    self.assertEqual(new_static_params.theta_imp, 0.5)
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -28,6 +28,7 @@ from typing import Optional
 import chex
 import jax
 from jax import numpy as jnp
+from torax import jax_utils
 
 
 def _zero() -> jax.Array:
@@ -113,21 +114,19 @@ class CellVariable:
     - `sanity_check` is guaranteed not to change the object, while
     `__post_init__` could in principle make changes.
     """
-    # Automatically check dtypes of all numeric fields
+    # Automatically check dtypes of all numeric fields. CellVariables are built
+    # many times per step, so read the expected dtype only once.
+    expected_dtype = jax_utils.get_dtype()
     for name, value in self.items():
       if name == 'history':
         # This is allowed to be a jax Array of bools that are all True, so it
         # shouldn't go through the same check as the other variables.
         continue
-      if isinstance(value, jax.Array):
-        if value.dtype != jnp.float64 and jax.config.read('jax_enable_x64'):
-          raise TypeError(
-              f'Expected dtype float64, got dtype {value.dtype} for `{name}`'
-          )
-        if value.dtype != jnp.float32 and not jax.config.read('jax_enable_x64'):
-          raise TypeError(
-              f'Expected dtype float32, got dtype {value.dtype} for `{name}`'
-          )
+      if isinstance(value, jax.Array) and value.dtype != expected_dtype:
+        raise TypeError(
+            f'Expected dtype {jnp.dtype(expected_dtype).name}, got dtype'
+            f' {value.dtype} for `{name}`'
+        )
     if self.history is None:
       # jax compilation seems to need to make a dummy version of this class with
       # (,) passed in for the value, so unfortunately we can't include this
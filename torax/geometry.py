@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import dataclasses
 import enum
+from typing import Any, Callable
 
 import chex
 import jax
@@ -29,7 +30,7 @@ from torax import geometry_loader
 from torax import jax_utils
 
 
-@chex.dataclass(frozen=True)
+@chex.dataclass(frozen=True, eq=False)
 class Grid1D:
   """Data structure defining a 1-D grid of cells with faces.
 
@@ -53,6 +54,21 @@ class Grid1D:
     jax_utils.assert_rank(self.face_centers, 1)
     jax_utils.assert_rank(self.cell_centers, 1)
 
+  # The generated field-wise __eq__ would compare the arrays elementwise (and
+  # be ambiguous). Grids are instead equal if they are the same object, or
+  # have the same face centers, which also determine the cell centers.
+  def __eq__(self, other: Any) -> bool:
+    if self is other:
+      return True
+    if not isinstance(other, Grid1D):
+      return NotImplemented
+    return self.nx == other.nx and np.array_equal(
+        self.face_centers, other.face_centers
+    )
+
+  def __hash__(self) -> int:
+    return hash(self.nx)
+
   @classmethod
   def construct(cls, nx: int, dx: chex.Array) -> Grid1D:
     """Constructs a Grid1D.
@@ -106,7 +122,7 @@ class GeometryType(enum.Enum):
 # pylint: disable=invalid-name
 
 
-@chex.dataclass(frozen=True)
+@chex.dataclass(frozen=True, eq=False)
 class Geometry:
   """Describes the magnetic geometry.
 
@@ -159,6 +175,17 @@ class Geometry:
   r_hires: chex.Array
   vpr_hires: chex.Array
 
+  # Geometries are compared and hashed by identity (hence eq=False above):
+  # field-wise equality would compare every array field, which is slow and
+  # ambiguous for arrays, and identity is what callers such as the runtime
+  # params slice cache rely on. These are defined explicitly so that they also
+  # take precedence over the Mapping methods of chex's mappable dataclasses.
+  def __hash__(self) -> int:
+    return id(self)
+
+  def __eq__(self, other: Any) -> bool:
+    return self is other
+
   @property
   def r_face(self) -> chex.Array:
     return self.r_face_norm * self.rmax
@@ -201,7 +228,7 @@ class Geometry:
     ))
 
 
-@chex.dataclass(frozen=True)
+@chex.dataclass(frozen=True, eq=False)
 class CircularAnalyticalGeometry(Geometry):
   """Circular geometry type used for testing only.
 
@@ -213,7 +240,7 @@ class CircularAnalyticalGeometry(Geometry):
   kappa_hires: chex.Array
 
 
-@chex.dataclass(frozen=True)
+@chex.dataclass(frozen=True, eq=False)
 class StandardGeometry(Geometry):
   """Standard geometry object including additional useful attributes, like psi.
 
@@ -598,6 +625,41 @@ class StandardGeometryIntermediates:
     )
 
 
+def _make_interp_onto(
+    x: chex.Array, xp: chex.Array
+) -> Callable[[chex.Array], chex.Array]:
+  """Returns a function computing `np.interp(x, xp, fp)` for a given `fp`.
+
+  The interval containing each point of `x` and the corresponding weights are
+  computed once, so the returned function is cheap to apply to many profiles
+  `fp` sampled on the same (increasing) grid `xp`.
+
+  Args:
+    x: The coordinates to interpolate onto.
+    xp: The increasing coordinates of the sampled data.
+
+  Returns:
+    A function mapping the sampled values `fp` to the values at `x`.
+  """
+  x = np.asarray(x)
+  xp = np.asarray(xp)
+  left = np.clip(np.searchsorted(xp, x, side='right') - 1, 0, len(xp) - 2)
+  right = left + 1
+  # Same arithmetic as np.interp, so that the results match it exactly.
+  dxp = xp[right] - xp[left]
+  offset = x - xp[left]
+  # As np.interp, use the boundary values outside of the range of xp.
+  below = x <= xp[0]
+  above = x >= xp[-1]
+
+  def interp(fp: chex.Array) -> chex.Array:
+    fp = np.asarray(fp)
+    value = (fp[right] - fp[left]) / dxp * offset + fp[left]
+    return np.where(below, fp[0], np.where(above, fp[-1], value))
+
+  return interp
+
+
 def build_standard_geometry(
     intermediate: StandardGeometryIntermediates
 ) -> StandardGeometry:
@@ -683,88 +745,76 @@ def build_standard_geometry(
   r_hires_norm = np.linspace(0, 1, intermediate.nr * intermediate.hires_fac)
   r_hires = r_hires_norm * rmax
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, vpr)
+  # All the profiles below are sampled on the same intermediate.rhon grid and
+  # interpolated onto the same three grids, so search for the intervals once
+  # per target grid rather than once per profile.
+  to_face = _make_interp_onto(r_face_norm, intermediate.rhon)
+  to_cell = _make_interp_onto(r_norm, intermediate.rhon)
+  to_hires = _make_interp_onto(r_hires_norm, intermediate.rhon)
+
   # V' for volume integrations on face grid
-  vpr_face = interp_func(r_face_norm)
+  vpr_face = to_face(vpr)
   # V' for volume integrations on cell grid
-  vpr_hires = interp_func(r_hires_norm)
-  vpr = interp_func(r_norm)
+  vpr_hires = to_hires(vpr)
+  vpr = to_cell(vpr)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, spr)
   # S' for area integrals on face grid
-  spr_face = interp_func(r_face_norm)
+  spr_face = to_face(spr)
   # S' for area integrals on cell grid
-  spr_cell = interp_func(r_norm)
-  spr_hires = interp_func(r_hires_norm)
+  spr_cell = to_cell(spr)
+  spr_hires = to_hires(spr)
 
   # triangularity on cell grid
-  interp_func = lambda x: np.interp(x, intermediate.rhon,
-                                    intermediate.delta_upper_face)
-  delta_upper_face = interp_func(r_face_norm)
-  interp_func = lambda x: np.interp(x, intermediate.rhon,
-                                    intermediate.delta_lower_face)
-  delta_lower_face = interp_func(r_face_norm)
+  delta_upper_face = to_face(intermediate.delta_upper_face)
+  delta_lower_face = to_face(intermediate.delta_lower_face)
 
   # average triangularity
   delta_face = 0.5 * (delta_upper_face + delta_lower_face)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, intermediate.RBphi)
-  F_face = interp_func(r_face_norm)
-  F_hires = interp_func(r_hires_norm)
-  F = interp_func(r_norm)
+  F_face = to_face(intermediate.RBphi)
+  F_hires = to_hires(intermediate.RBphi)
+  F = to_cell(intermediate.RBphi)
   # Normalized toroidal flux function
   J = F / intermediate.Rmaj / intermediate.B
   J_face = F_face / intermediate.Rmaj / intermediate.B
   J_hires = F_hires / intermediate.Rmaj / intermediate.B
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, intermediate.psi)
-  psi = interp_func(r_norm)
+  psi = to_cell(intermediate.psi)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, psi_from_Ip)
-  psi_from_Ip = interp_func(r_norm)
+  psi_from_Ip = to_cell(psi_from_Ip)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, jtot)
-  jtot_face = interp_func(r_face_norm)
-  jtot = interp_func(r_norm)
+  jtot_face = to_face(jtot)
+  jtot = to_cell(jtot)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, intermediate.Rin)
-  Rin_face = interp_func(r_face_norm)
-  Rin = interp_func(r_norm)
+  Rin_face = to_face(intermediate.Rin)
+  Rin = to_cell(intermediate.Rin)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, intermediate.Rout)
-  Rout_face = interp_func(r_face_norm)
-  Rout = interp_func(r_norm)
+  Rout_face = to_face(intermediate.Rout)
+  Rout = to_cell(intermediate.Rout)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, g0)
-  g0_face = interp_func(r_face_norm)
-  g0 = interp_func(r_norm)
+  g0_face = to_face(g0)
+  g0 = to_cell(g0)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, g1)
-  g1_face = interp_func(r_face_norm)
-  g1 = interp_func(r_norm)
+  g1_face = to_face(g1)
+  g1 = to_cell(g1)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, g2)
-  g2_face = interp_func(r_face_norm)
-  g2 = interp_func(r_norm)
+  g2_face = to_face(g2)
+  g2 = to_cell(g2)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, g3)
-  g3_face = interp_func(r_face_norm)
-  g3 = interp_func(r_norm)
+  g3_face = to_face(g3)
+  g3 = to_cell(g3)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, g2g3_over_rho)
-  g2g3_over_rho_face = interp_func(r_face_norm)
-  g2g3_over_rho_hires = interp_func(r_hires_norm)
-  g2g3_over_rho = interp_func(r_norm)
+  g2g3_over_rho_face = to_face(g2g3_over_rho)
+  g2g3_over_rho_hires = to_hires(g2g3_over_rho)
+  g2g3_over_rho = to_cell(g2g3_over_rho)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, intermediate.volume)
-  volume_face = interp_func(r_face_norm)
-  volume_hires = interp_func(r_hires_norm)
-  volume = interp_func(r_norm)
+  volume_face = to_face(intermediate.volume)
+  volume_hires = to_hires(intermediate.volume)
+  volume = to_cell(intermediate.volume)
 
-  interp_func = lambda x: np.interp(x, intermediate.rhon, intermediate.area)
-  area_face = interp_func(r_face_norm)
-  area_hires = interp_func(r_hires_norm)
-  area = interp_func(r_norm)
+  area_face = to_face(intermediate.area)
+  area_hires = to_hires(intermediate.area)
+  area = to_cell(intermediate.area)
 
   return StandardGeometry(
       geometry_type=GeometryType.CHEASE.value,
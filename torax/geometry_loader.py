@@ -13,6 +13,7 @@
 # limitations under the License.
 
 """File I/O for loading geometry files."""
+import functools
 import os
 
 import jax.numpy as jnp
@@ -57,6 +58,19 @@ def load_chease_data(
       geometry_dir = 'torax/data/third_party/geo'
 
   # initialize geometry from file
-  return initialize_CHEASE_dict(
-      file_path=os.path.join(geometry_dir, geometry_file)
-  )
+  file_path = os.path.join(geometry_dir, geometry_file)
+  # Parsing the file is slow compared to building the geometry from it, and
+  # the same file is typically loaded several times, e.g. once per config or
+  # per test case. The modification time is part of the cache key so that
+  # changes to the file are still picked up.
+  return dict(_load_chease_file(file_path, os.path.getmtime(file_path)))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_chease_file(
+    file_path: str,
+    mtime: float,
+) -> dict[str, jnp.ndarray]:
+  """Cached initialize_CHEASE_dict. Callers must not mutate the result."""
+  del mtime  # Only used as part of the cache key.
+  return initialize_CHEASE_dict(file_path=file_path)
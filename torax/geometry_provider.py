@@ -19,6 +19,7 @@ from __future__ import annotations
 from typing import Protocol
 
 import chex
+import jax
 from torax import geometry
 
 
@@ -65,17 +66,38 @@ class GeometryProvider(Protocol):
     """
 
 
+@jax.tree_util.register_pytree_node_class
 class ConstantGeometryProvider(GeometryProvider):
-  """Returns the same Geometry for all calls."""
+  """Returns the same Geometry for all calls.
+
+  The provider is a pytree whose only child is the geometry, so it can be
+  passed to jitted functions, where calling it just returns the (traced)
+  geometry.
+  """
 
   def __init__(self, geo: geometry.Geometry):
     self._geo = geo
 
+  @property
+  def geo(self) -> geometry.Geometry:
+    return self._geo
+
   def __call__(
       self,
-      t: chex.Numeric,
+      t: chex.Numeric,  # pylint: disable=unused-argument
   ) -> geometry.Geometry:
     # The API includes time as an arg even though it is unused in order
     # to match the API of a GeometryProvider.
-    del t  # Ignored.
     return self._geo
+
+  def tree_flatten(self) -> tuple[tuple[geometry.Geometry], None]:
+    return (self._geo,), None
+
+  @classmethod
+  def tree_unflatten(
+      cls,
+      aux_data: None,
+      children: tuple[geometry.Geometry],
+  ) -> ConstantGeometryProvider:
+    del aux_data  # Unused.
+    return cls(*children)
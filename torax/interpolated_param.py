@@ -17,8 +17,11 @@
 import abc
 from collections.abc import Mapping
 import enum
+import functools
 import chex
+import jax
 import jax.numpy as jnp
+import numpy as np
 from torax import jax_utils
 
 
@@ -70,6 +73,39 @@ class JaxFriendlyInterpolatedParam(InterpolatedParamBase):
   """
 
 
+def _check_sorted(xs: jnp.ndarray) -> None:
+  """Errors (if errors are enabled) if xs is not sorted."""
+  # xs built from config inputs are sorted already, which a host-side check on
+  # the concrete values confirms without dispatching the sort and reduction.
+  if not isinstance(xs, jax.core.Tracer):
+    xs_np = np.asarray(xs)
+    if np.all(xs_np[1:] >= xs_np[:-1]):
+      return
+  diff = jnp.sum(jnp.abs(jnp.sort(xs) - xs))
+  jax_utils.error_if(diff, diff > 1e-8, 'xs must be sorted.')
+
+
+def _get_slopes(xs: jnp.ndarray, ys: jnp.ndarray) -> jnp.ndarray:
+  """Returns the slope of each interval, with 0 for zero-width intervals."""
+  dxs = jnp.diff(xs)
+  return jnp.where(
+      dxs == 0.0, 0.0, jnp.diff(ys) / jnp.where(dxs == 0.0, 1.0, dxs)
+  )
+
+
+def _get_uniform_spacing(xs: jnp.ndarray) -> tuple[float, float] | None:
+  """Returns (xs[0], 1 / spacing) if xs are concrete and evenly spaced."""
+  if isinstance(xs, jax.core.Tracer) or xs.shape[0] < 2:
+    return None
+  xs_np = np.asarray(xs, dtype=np.float64)
+  dxs = np.diff(xs_np)
+  # The tolerance is tight, so that rounding x into the wrong interval only
+  # happens within a few ulps of a knot, where both intervals agree.
+  if dxs[0] <= 0.0 or not np.allclose(dxs, dxs[0], rtol=1e-12, atol=0.0):
+    return None
+  return float(xs_np[0]), float(1.0 / dxs[0])
+
+
 @chex.dataclass(frozen=True)
 class PiecewiseLinearInterpolatedParam(JaxFriendlyInterpolatedParam):
   """Parameter using piecewise-linear interpolation to compute its value."""
@@ -80,14 +116,97 @@ class PiecewiseLinearInterpolatedParam(JaxFriendlyInterpolatedParam):
   def __post_init__(self):
     jax_utils.assert_rank(self.xs, 1)
     assert self.xs.shape == self.ys.shape
-    diff = jnp.sum(jnp.abs(jnp.sort(self.xs) - self.xs))
-    jax_utils.error_if(diff, diff > 1e-8, 'xs must be sorted.')
+    _check_sorted(self.xs)
+    # Precompute the slope of each interval, so that a lookup does not need to
+    # divide, and the spacing of evenly spaced xs.
+    # Must use object.__setattr__ here because this is frozen dataclass.
+    object.__setattr__(self, '_slopes', _get_slopes(self.xs, self.ys))
+    object.__setattr__(self, '_uniform_spacing', _get_uniform_spacing(self.xs))
+    # Host copies of xs and ys, to look up plain NumPy or Python coordinates
+    # without dispatching JAX ops, e.g. when called outside of jit.
+    object.__setattr__(self, '_host_arrays', None)
+    if not isinstance(self.xs, jax.core.Tracer) and not isinstance(
+        self.ys, jax.core.Tracer
+    ):
+      object.__setattr__(
+          self,
+          '_host_arrays',
+          (np.asarray(self.xs), np.asarray(self.ys)),
+      )
 
   def get_value(
       self,
       x: chex.Numeric,
   ) -> jnp.ndarray:
-    return jnp.interp(x, self.xs, self.ys)
+    host_arrays = getattr(self, '_host_arrays', None)
+    if host_arrays is not None and isinstance(
+        x, (float, int, np.ndarray, np.generic)
+    ):
+      # np.interp clamps to the end values and is exact at the knots, like the
+      # JAX path. Only the result is moved to the device, with the dtype the
+      # JAX path would give it, so both paths return the same kind of array.
+      return jnp.asarray(
+          np.interp(np.asarray(x), *host_arrays),
+          dtype=jnp.result_type(x, self.ys),
+      )
+    # The precomputed attributes are not pytree leaves, so are missing if this
+    # was rebuilt by unflattening, e.g. as an argument of a jitted function.
+    slopes = getattr(self, '_slopes', None)
+    if slopes is None:
+      slopes = _get_slopes(self.xs, self.ys)
+    return self._interpolate(self.ys, slopes, x)
+
+  def get_value_for_ys(
+      self,
+      ys: jnp.ndarray,
+      x: chex.Numeric,
+  ) -> jnp.ndarray:
+    """Returns the value at x for other values ys given at the same xs.
+
+    This does not build (and so validate) a new param for ys, e.g. when ys is
+    computed inside a jitted function.
+
+    Args:
+      ys: Values at xs, with the same shape as self.ys.
+      x: The coordinate to interpolate at.
+    """
+    return self._interpolate(ys, _get_slopes(self.xs, ys), x)
+
+  def _interpolate(
+      self,
+      ys: jnp.ndarray,
+      slopes: jnp.ndarray,
+      x: chex.Numeric,
+  ) -> jnp.ndarray:
+    # Same as jnp.interp(x, self.xs, ys), but the values below xs come from
+    # clamping x to the interval rather than from a separate where() pass over
+    # the output.
+    if self.xs.shape[0] == 1:
+      return jnp.broadcast_to(
+          jnp.asarray(ys[0], dtype=jnp.result_type(x, ys)), jnp.shape(x)
+      )
+    uniform_spacing = getattr(self, '_uniform_spacing', None)
+    # Index of the right end of the interval containing x.
+    if uniform_spacing is not None:
+      # Evenly spaced xs (e.g. from np.linspace) give the interval directly.
+      x_start, inverse_dx = uniform_spacing
+      idx = (
+          jnp.clip(
+              jnp.floor((x - x_start) * inverse_dx), 0, self.xs.shape[0] - 2
+          ).astype(jnp.int32)
+          + 1
+      )
+    else:
+      idx = jnp.clip(
+          jnp.searchsorted(self.xs, x, side='right'), 1, self.xs.shape[0] - 1
+      )
+    x0 = self.xs[idx - 1]
+    x1 = self.xs[idx]
+    value = ys[idx - 1] + (jnp.clip(x, x0, x1) - x0) * slopes[idx - 1]
+    # The slope formula only gives ys[idx] up to rounding, so use it directly
+    # at the right end of the interval (and so also at and beyond xs[-1]). This
+    # keeps the values at the knots exact, as with jnp.interp and np.interp.
+    return jnp.where(x >= x1, ys[idx], value)
 
 
 @chex.dataclass(frozen=True)
@@ -100,31 +219,35 @@ class StepInterpolatedParam(JaxFriendlyInterpolatedParam):
   def __post_init__(self):
     jax_utils.assert_rank(self.xs, 1)
     assert self.xs.shape == self.ys.shape
-    diff = jnp.sum(jnp.abs(jnp.sort(self.xs) - self.xs))
-    jax_utils.error_if(diff, diff > 1e-8, 'xs must be sorted.')
-    # Precompute some arrays useful for computing values.
-    # Must use object.__setattr__ here because this is frozen dataclass.
-    object.__setattr__(
-        self,
-        '_padded_xs',
-        jnp.concatenate([jnp.array([-jnp.inf]), self.xs, jnp.array([jnp.inf])]),
-    )
-    object.__setattr__(
-        self,
-        '_padded_ys',
-        jnp.concatenate(
-            [jnp.array([self.ys[0]]), self.ys, jnp.array([self.ys[-1]])]
-        ),
-    )
+    _check_sorted(self.xs)
 
   def get_value(
       self,
       x: chex.Numeric,
   ) -> jnp.ndarray:
-    # pytype: disable=attribute-error
-    idx = jnp.max(jnp.argwhere(self._padded_xs < x).flatten())
-    return self._padded_ys[idx]
-    # pytype: enable=attribute-error
+    return self.get_value_for_ys(self.ys, x)
+
+  def get_value_for_ys(
+      self,
+      ys: jnp.ndarray,
+      x: chex.Numeric,
+  ) -> jnp.ndarray:
+    """Returns the value at x for other values ys given at the same xs.
+
+    This does not build (and so validate) a new param for ys, e.g. when ys is
+    computed inside a jitted function.
+
+    Args:
+      ys: Values at xs, with the same shape as self.ys.
+      x: The coordinate to interpolate at.
+    """
+    # Index of the last x strictly less than x, clipped to the ends of xs so
+    # that the boundary values are used outside of xs. Unlike argwhere, this
+    # has a static output shape so also works under jit.
+    idx = jnp.clip(
+        jnp.searchsorted(self.xs, x, side='left') - 1, 0, self.xs.shape[0] - 1
+    )
+    return ys[idx]
 
 
 # Config input types convertible to InterpolatedParam objects.
@@ -134,18 +257,61 @@ InterpolatedVar2dInput = Mapping[float, InterpolatedVar1dInput] | float
 
 def _convert_input_to_xs_ys(
     interp_input: InterpolatedVar1dInput,
+    dtype: jnp.dtype | None = None,
 ) -> tuple[jnp.ndarray, jnp.ndarray]:
   """Converts config inputs into inputs suitable for constructors."""
   # This function does NOT need to be jittable.
   if isinstance(interp_input, dict):
     if not interp_input:
       raise ValueError('InterpolatedVar1dInput must include values.')
-    sorted_keys = sorted(interp_input.keys())
-    values = [interp_input[key] for key in sorted_keys]
-    return jnp.array(sorted_keys), jnp.array(values)
+    # Read the items into a single (n, 2) buffer and sort its rows by key,
+    # rather than building and sorting Python lists of keys and values.
+    items = np.fromiter(
+        interp_input.items(),
+        dtype=np.dtype((np.float64, 2)),
+        count=len(interp_input),
+    )
+    items = items[np.argsort(items[:, 0], kind='stable')]
+    sorted_keys = tuple(items[:, 0].tolist())
+    values = items[:, 1]
   else:
     # The input is a single value.
-    return jnp.array([0]), jnp.array([interp_input])
+    sorted_keys = (0.0,)
+    values = np.array([interp_input], dtype=np.float64)
+  # Store xs and ys in the float dtype of the simulation (unless another one is
+  # requested), so that integer inputs (e.g. {0: 1, 1: 2}) do not need to be
+  # promoted on every lookup.
+  if dtype is None:
+    dtype = jax_utils.get_dtype()
+  return (
+      _get_shared_xs(sorted_keys, np.dtype(dtype)),
+      jnp.asarray(values, dtype=dtype),
+  )
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_shared_xs(
+    sorted_keys: tuple[float, ...], dtype: np.dtype
+) -> jax.Array:
+  """Returns the (shared) xs array for the given interpolation knots.
+
+  Many params are given at the same knots (e.g. the same times). Sharing one
+  xs array between them means that, when several of them are interpolated in
+  the same jitted function, their index lookups act on the same constant and
+  XLA can compute the lookup once for all of them.
+
+  Args:
+    sorted_keys: The sorted knots.
+    dtype: The dtype of the array.
+
+  Returns:
+    The knots as a 1D array. Must not be modified.
+  """
+  # Make sure the shared array is concrete even if first created while tracing.
+  with jax.ensure_compile_time_eval():
+    return jnp.asarray(
+        np.fromiter(sorted_keys, dtype=dtype, count=len(sorted_keys))
+    )
 
 
 def _is_bool(interp_input: InterpolatedVar1dInput) -> bool:
@@ -165,6 +331,7 @@ def _convert_value_to_floats(
   return float(interp_input)
 
 
+@jax.tree_util.register_pytree_node_class
 class InterpolatedVar1d(InterpolatedParamBase):
   """Parameter that may vary based on an input coordinate.
 
@@ -172,6 +339,10 @@ class InterpolatedVar1d(InterpolatedParamBase):
   be used to define any parameters that vary across some range. This class is
   the main "user-facing" class defined in this module.
 
+  It is a pytree whose leaves are the arrays of the underlying param, so it can
+  be passed to jitted functions: params with the same number of knots and the
+  same kind share a compiled function.
+
   See `config.runtime_params.RuntimeParams` and associated tests to see how this
   is used.
   """
@@ -182,6 +353,7 @@ class InterpolatedVar1d(InterpolatedParamBase):
       interpolation_mode: InterpolationMode = (
           InterpolationMode.PIECEWISE_LINEAR
       ),
+      dtype: jnp.dtype | None = None,
   ):
     """Initializes InterpolatedVar1d.
 
@@ -191,11 +363,16 @@ class InterpolatedVar1d(InterpolatedParamBase):
         given, then the output value will be constant. If no values are given in
         the dict, then an error is raised.
       interpolation_mode: Defines how to interpolate between values in `value`.
+      dtype: Float dtype to store the coordinates and values in. Defaults to the
+        float dtype of the simulation. A lower precision one, e.g. float32 for
+        a float64 simulation, halves the memory read by lookups for params
+        that do not need full precision. Piecewise-linear lookups at a higher
+        precision coordinate are still returned at that precision.
     """
     self._is_bool_param = _is_bool(value)
     if self._is_bool_param:
       value = _convert_value_to_floats(value)
-    xs, ys = _convert_input_to_xs_ys(value)
+    xs, ys = _convert_input_to_xs_ys(value, dtype)
     match interpolation_mode:
       case InterpolationMode.PIECEWISE_LINEAR:
         self._param = PiecewiseLinearInterpolatedParam(xs=xs, ys=ys)
@@ -203,17 +380,55 @@ class InterpolatedVar1d(InterpolatedParamBase):
         self._param = StepInterpolatedParam(xs=xs, ys=ys)
       case _:
         raise ValueError('Unknown interpolation mode.')
+    # Constant params (a single value, the most common input) skip the
+    # interpolation entirely.
+    self._constant_value = None
+    if xs.shape[0] == 1:
+      with jax.ensure_compile_time_eval():
+        self._constant_value = (
+            jnp.bool_(ys[0] > 0.5) if self._is_bool_param else ys[0]
+        )
 
   def get_value(
       self,
       x: chex.Numeric,
   ) -> jnp.ndarray:
     """Returns a single value for this range at the given coordinate."""
+    if self._constant_value is not None:
+      value = self._constant_value
+      if not self._is_bool_param and isinstance(
+          self._param, PiecewiseLinearInterpolatedParam
+      ):
+        # Promote to the dtype of x, like the interpolation does.
+        dtype = jnp.result_type(x, value)
+        if dtype != value.dtype:
+          value = value.astype(dtype)
+      if jnp.ndim(x) == 0:
+        return value
+      return jnp.broadcast_to(value, jnp.shape(x))
     value = self._param.get_value(x)
     if self._is_bool_param:
       return jnp.bool_(value > 0.5)
     return value
 
+  def tree_flatten(self):
+    return (self._param,), self._is_bool_param
+
+  @classmethod
+  def tree_unflatten(cls, aux_data, children):
+    # Unflattening must not validate or compute anything, since JAX may call it
+    # with placeholder leaves.
+    obj = object.__new__(cls)
+    (obj._param,) = children
+    obj._is_bool_param = aux_data
+    # The constant fast path is only for the concrete params built in __init__;
+    # the underlying param gives the same values. Likewise, the underlying
+    # param may be rebuilt without its precomputed attributes, in which case
+    # it looks up x through the generic path, which agrees with the others
+    # (and exactly so at the knots).
+    obj._constant_value = None
+    return obj
+
   @property
   def param(self) -> JaxFriendlyInterpolatedParam:
     """Returns the JAX-friendly interpolated param used under the hood."""
@@ -225,6 +440,11 @@ class InterpolatedVar1d(InterpolatedParamBase):
     return self._is_bool_param
 
 
+# Maximum number of rho grids an InterpolatedVar2d keeps tables for. Usually a
+# simulation only uses one or two.
+_MAX_RHO_GRIDS = 8
+
+
 class InterpolatedVar2d:
   """Interpolates on a grid (time, rho).
 
@@ -233,6 +453,12 @@ class InterpolatedVar2d:
   interpolates along time to provide a value at any (time, rho) pair.
   - For time values that are outside the range of `values` the closest defined
   `InterpolatedVar1d` is used.
+
+  For a fixed rho grid, the values at all defined times are kept in a single
+  contiguous (time, rho) array, so a lookup reads two rows of one buffer rather
+  than evaluating one `InterpolatedVar1d` per defined time.
+  - The profiles along rho can be stored at a lower precision by passing
+  `rho_dtype`, see the `dtype` argument of `InterpolatedVar1d`.
   """
 
   def __init__(
@@ -241,6 +467,7 @@ class InterpolatedVar2d:
       rho_interpolation_mode: InterpolationMode = (
           InterpolationMode.PIECEWISE_LINEAR
       ),
+      rho_dtype: jnp.dtype | None = None,
   ):
     # If a float is passed in, will describe constant initial condition profile.
     if isinstance(values, float):
@@ -258,10 +485,77 @@ class InterpolatedVar2d:
     if not values:
       raise ValueError('Values mapping must not be empty.')
     self.times_values = {
-        v: InterpolatedVar1d(values[v], rho_interpolation_mode)
+        v: InterpolatedVar1d(values[v], rho_interpolation_mode, rho_dtype)
         for v in values.keys()
     }
-    self.sorted_indices = jnp.array(sorted(values.keys()))
+    # The times are sorted once here rather than on every lookup.
+    self._sorted_times = tuple(sorted(values.keys()))
+    self.sorted_indices = jnp.asarray(
+        np.fromiter(
+            self._sorted_times,
+            dtype=jax_utils.get_dtype(),
+            count=len(self._sorted_times),
+        )
+    )
+    # If the profiles at all times are given at the same rho knots, blending
+    # their values in time before interpolating along rho is equivalent to
+    # interpolating each of them along rho and blending the results, but needs
+    # a single interpolation along rho. Keep a (time, knot) table for that.
+    # Bool params are excluded, since they are thresholded after interpolating.
+    params = [self.times_values[t] for t in self._sorted_times]
+    self._ys_on_knots = None
+    if all(
+        p.param.xs is params[0].param.xs
+        and type(p.param) is type(params[0].param)
+        and not p.is_bool_param
+        for p in params
+    ):
+      self._ys_on_knots = jnp.stack([p.param.ys for p in params])
+    # Values of each InterpolatedVar1d on the rho grids seen so far, keyed by
+    # the contents of the grid. See `_get_values_on_rho`.
+    self._values_on_rho = {}
+    # The last rho array seen and its table, to skip building the key when the
+    # same grid object (e.g. geo.mesh.face_centers) is passed on every step.
+    self._last_rho = None
+    self._last_values_on_rho = None
+
+  def _get_values_on_rho(self, rho: chex.Numeric) -> jnp.ndarray | None:
+    """Returns a (time, rho) table of the values interpolated along rho.
+
+    Interpolating along rho does not depend on time, so for a fixed rho grid
+    (e.g. the face centers of the geometry) it is done once and the table is
+    reused for all subsequent times.
+
+    Args:
+      rho: The rho-coordinates to interpolate at.
+
+    Returns:
+      An array of shape (len(sorted_indices),) + rho.shape, or None if rho is
+      traced and so cannot be used as a key.
+    """
+    if isinstance(rho, jax.core.Tracer):
+      return None
+    # Grids come from frozen geometry objects and are not updated in place, so
+    # the same object always has the same contents.
+    if rho is self._last_rho:
+      return self._last_values_on_rho
+    rho_array = np.asarray(rho)
+    key = (rho_array.shape, rho_array.dtype.str, rho_array.tobytes())
+    values_on_rho = self._values_on_rho.get(key)
+    if values_on_rho is None:
+      # Make sure the cached table is concrete even if first requested from
+      # inside a jitted function.
+      with jax.ensure_compile_time_eval():
+        values_on_rho = jnp.stack([
+            self.times_values[t].get_value(rho_array)
+            for t in self._sorted_times
+        ])
+      if len(self._values_on_rho) >= _MAX_RHO_GRIDS:
+        self._values_on_rho.clear()
+      self._values_on_rho[key] = values_on_rho
+    self._last_rho = rho
+    self._last_values_on_rho = values_on_rho
+    return values_on_rho
 
   def get_value(
       self,
@@ -270,32 +564,57 @@ class InterpolatedVar2d:
   ) -> jnp.ndarray:
     """Returns the value of this parameter interpolated at the given (time,rho).
 
-    This method is not jittable as it is.
+    This method can be jitted with a traced time and rho.
 
     Args:
-      time: The time-coordinate to interpolate at.
+      time: The time-coordinate to interpolate at. Can also be an array of
+        times, which are all looked up at once.
       rho: The rho-coordinate to interpolate at.
     Returns:
-      The value of the interpolated at the given (time,rho).
+      The value of the interpolated at the given (time,rho), with shape
+      time.shape + rho.shape.
     """
-    # Find the index that is left of value which time is closest to.
-    left = jnp.searchsorted(self.sorted_indices, time, side='left')
-
-    # If time is either smaller or larger, than smallest and largest values
-    # we know how to interpolate for, use the boundary interpolater.
-    if left == 0:
-      return self.times_values[float(self.sorted_indices[0])].get_value(rho)
-    if left == len(self.sorted_indices):
-      return self.times_values[float(self.sorted_indices[-1])].get_value(rho)
-
-    # Interpolate between the two closest defined interpolaters.
-    left_time = float(self.sorted_indices[left - 1])
-    right_time = float(self.sorted_indices[left])
-    return self.times_values[left_time].get_value(rho) * (right_time - time) / (
-        right_time - left_time
-    ) + self.times_values[right_time].get_value(rho) * (time - left_time) / (
-        right_time - left_time
+    values_on_rho = self._get_values_on_rho(rho)
+    if (
+        values_on_rho is None
+        and self._ys_on_knots is not None
+        and jnp.ndim(time) == 0
+    ):
+      # rho is traced, so interpolate along rho once, after blending in time.
+      rho_param = self.times_values[self._sorted_times[0]].param
+      return rho_param.get_value_for_ys(
+          self._interpolate_in_time(self._ys_on_knots, time), rho
+      )
+    if values_on_rho is None:
+      values_on_rho = jnp.stack(
+          [self.times_values[t].get_value(rho) for t in self._sorted_times]
+      )
+    return self._interpolate_in_time(values_on_rho, time)
+
+  def _interpolate_in_time(
+      self,
+      rows: jnp.ndarray,
+      time: chex.Numeric,
+  ) -> jnp.ndarray:
+    """Linearly interpolates in time between rows given at sorted_indices."""
+    if len(self.sorted_indices) == 1:
+      return jnp.broadcast_to(rows[0], jnp.shape(time) + rows.shape[1:])
+
+    # Linearly interpolate in time between the two closest defined rows. For
+    # times outside of the defined range the weight is clipped, so the
+    # boundary row is used. This has no Python branching on time, so can be
+    # traced.
+    right = jnp.clip(
+        jnp.searchsorted(self.sorted_indices, time, side='left'),
+        1,
+        len(self.sorted_indices) - 1,
     )
+    left_time = self.sorted_indices[right - 1]
+    right_time = self.sorted_indices[right]
+    weight = jnp.clip((time - left_time) / (right_time - left_time), 0.0, 1.0)
+    # For an array of times, weight each of their rows.
+    weight = jnp.reshape(weight, jnp.shape(weight) + (1,) * (rows.ndim - 1))
+    return rows[right - 1] * (1.0 - weight) + rows[right] * weight
 
 
 # In runtime_params, users should be able to either specify the
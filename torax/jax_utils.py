@@ -16,9 +16,11 @@
 
 import contextlib
 import dataclasses
+import functools
 import os
 from typing import Any, Callable, Optional, TypeVar, Union
 
+from absl import logging
 import chex
 import equinox as eqx
 import jax
@@ -61,6 +63,10 @@ _errors_enabled = env_bool('TORAX_ERRORS_ENABLED', False)
 # of most torax modules at import time.
 _compilation_enabled = env_bool('TORAX_COMPILATION_ENABLED', True)
 
+# If True, jax_utils.jit logs a warning whenever a function is traced again,
+# i.e. whenever a change in its inputs triggers a recompile.
+_log_retraces = env_bool('TORAX_LOG_RETRACES', False)
+
 
 @contextlib.contextmanager
 def enable_errors(value: bool):
@@ -157,6 +163,13 @@ def error_if_negative(
   return error_if(to_wrap, min_var < 0, msg)
 
 
+def get_dtype() -> Any:
+  """Returns the float dtype for the current precision (see JAX_PRECISION)."""
+  # Read at call time, since torax/__init__.py sets jax_enable_x64 after this
+  # module has been imported.
+  return jnp.float64 if jax.config.read('jax_enable_x64') else jnp.float32
+
+
 def jax_default(value: chex.Numeric) -> ...:
   """Define a dataclass field with a jax-type default value.
 
@@ -232,10 +245,31 @@ def is_tracer(var: jax.Array) -> bool:
 def jit(*args, **kwargs) -> Callable[..., Any]:
   """Calls jax.jit iff TORAX_COMPILATION_ENABLED is True."""
   if _compilation_enabled:
+    if _log_retraces:
+      return jax.jit(_log_traces(args[0]), *args[1:], **kwargs)
     return jax.jit(*args, **kwargs)
   return args[0]
 
 
+def _log_traces(fun: Callable[..., T]) -> Callable[..., T]:
+  """Wraps `fun` to log a warning every time it is traced after the first."""
+  num_traces = 0
+
+  @functools.wraps(fun)
+  def wrapper(*args, **kwargs):
+    nonlocal num_traces
+    num_traces += 1
+    if num_traces > 1:
+      logging.warning(
+          'Retracing %s (trace #%d).',
+          getattr(fun, '__qualname__', repr(fun)),
+          num_traces,
+      )
+    return fun(*args, **kwargs)
+
+  return wrapper
+
+
 def py_while(
     cond_fun: Callable[[T], BooleanNumeric],
     body_fun: Callable[[T], T],
@@ -27,13 +27,14 @@ it easier to print error messages in context).
 from __future__ import annotations
 
 import dataclasses
+import functools
+import math
 import time
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
 from absl import logging
 import jax
 import jax.numpy as jnp
-import numpy as np
 from torax import calc_coeffs
 from torax import core_profile_setters
 from torax import geometry
@@ -50,6 +51,7 @@ from torax.sources import source_profiles as source_profiles_lib
 from torax.spectators import spectator as spectator_lib
 from torax.stepper import stepper as stepper_lib
 from torax.time_step_calculator import chi_time_step_calculator
+from torax.time_step_calculator import fixed_time_step_calculator
 from torax.time_step_calculator import time_step_calculator as ts
 from torax.transport_model import transport_model as transport_model_lib
 
@@ -283,30 +285,26 @@ class SimulationStepFn:
         transport_coeffs,
     )
 
-    crosses_t_final = (
-        input_state.t < dynamic_runtime_params_slice_t.numerics.t_final
-    ) * (
-        input_state.t + input_state.dt
-        > dynamic_runtime_params_slice_t.numerics.t_final
-    )
-    dt = jnp.where(
-        jnp.logical_and(
-            dynamic_runtime_params_slice_t.numerics.exact_t_final,
-            crosses_t_final,
-        ),
-        dynamic_runtime_params_slice_t.numerics.t_final - input_state.t,
-        dt,
+    dt, dt_is_nan = _clip_dt_to_t_final(
+        t=input_state.t,
+        previous_dt=input_state.dt,
+        dt=dt,
+        t_final=dynamic_runtime_params_slice_t.numerics.t_final,
+        exact_t_final=dynamic_runtime_params_slice_t.numerics.exact_t_final,
     )
-    if jnp.any(jnp.isnan(dt)):
+    # Reading the flag waits for dt, but this does not cost an extra sync:
+    # building the slice at t + dt below needs the concrete value of t + dt on
+    # the host anyway (it is part of the slice provider's cache key), so
+    # deferring the check would not let more work be queued on the device.
+    if dt_is_nan:
       raise ValueError('dt is NaN.')
 
     # The stepper needs the dynamic_runtime_params_slice at time t + dt for
     # implicit computations in the solver.
-    geo_t_plus_dt = geometry_provider(input_state.t + dt)
+    t_plus_dt = input_state.t + dt
+    geo_t_plus_dt = geometry_provider(t_plus_dt)
     dynamic_runtime_params_slice_t_plus_dt = (
-        dynamic_runtime_params_slice_provider(
-            input_state.t + dt, geo_t_plus_dt,
-        )
+        dynamic_runtime_params_slice_provider(t_plus_dt, geo_t_plus_dt)
     )
 
     core_profiles_t = input_state.core_profiles
@@ -351,6 +349,9 @@ class SimulationStepFn:
         stepper_error_state=stepper_error_state,
     )
 
+    # Set by the adaptive time step routine below when it reduces dt.
+    dt_was_reduced = False
+
     if static_runtime_params_slice.adaptive_dt:
       # Check if stepper converged. If not, proceed to body_fun
       def cond_fun(updated_output: state.ToraxSimState) -> bool:
@@ -366,6 +367,8 @@ class SimulationStepFn:
       def body_fun(
           updated_output: state.ToraxSimState,
       ) -> state.ToraxSimState:
+        nonlocal dt_was_reduced
+        dt_was_reduced = True
 
         dt = (
             updated_output.dt
@@ -415,13 +418,20 @@ class SimulationStepFn:
 
       output_state = jax_utils.py_while(cond_fun, body_fun, output_state)
 
+    # The geometry and runtime params at t + dt only need to be provided again
+    # if the adaptive time step routine changed dt. (If the routine is ever
+    # traced, the flag is set even if it does not run, and they are
+    # conservatively provided again.)
+    if dt_was_reduced:
+      geo_t_plus_dt = geometry_provider(input_state.t + output_state.dt)
+      dynamic_runtime_params_slice_t_plus_dt = (
+          dynamic_runtime_params_slice_provider(
+              input_state.t + output_state.dt,
+              geo_t_plus_dt,
+          )
+      )
+
     # Update total current, q, and s profiles based on new psi
-    dynamic_runtime_params_slice_t_plus_dt = (
-        dynamic_runtime_params_slice_provider(
-            input_state.t + output_state.dt, geo_t_plus_dt,
-        )
-    )
-    geo_t_plus_dt = geometry_provider(input_state.t + output_state.dt)
 
     q_corr = dynamic_runtime_params_slice_t_plus_dt.numerics.q_correction_factor
     output_state.core_profiles = physics.update_jtot_q_face_s_face(
@@ -586,7 +596,8 @@ class Sim:
       self,
       log_timestep_info: bool = False,
       spectator: spectator_lib.Spectator | None = None,
-  ) -> tuple[state.ToraxSimState, ...]:
+      keep_state_history: bool = True,
+  ) -> Sequence[state.ToraxSimState]:
     """Runs the transport simulation over a prescribed time interval.
 
     See `run_simulation` for details.
@@ -600,10 +611,12 @@ class Sim:
         argument is ignored and the spectator built into the SimulationStepFn
         cannot change. In these cases where you want to use a new spectator, you
         must build a new Sim object.
+      keep_state_history: See `run_simulation()`.
 
     Returns:
-      Tuple of all ToraxSimStates, one per time step and an additional one at
-      the beginning for the starting state.
+      Sequence of all ToraxSimStates, one per time step and an additional one
+      at the beginning for the starting state. Only the starting and final
+      states if keep_state_history is False.
     """
     if self._step_fn is None:
       self._step_fn = SimulationStepFn(
@@ -623,6 +636,7 @@ class Sim:
         step_fn=self.step_fn,
         log_timestep_info=log_timestep_info,
         spectator=spectator,
+        keep_state_history=keep_state_history,
     )
 
 
@@ -711,7 +725,8 @@ def run_simulation(
     step_fn: SimulationStepFn,
     log_timestep_info: bool = False,
     spectator: spectator_lib.Spectator | None = None,
-) -> tuple[state.ToraxSimState, ...]:
+    keep_state_history: bool = True,
+) -> Sequence[state.ToraxSimState]:
   """Runs the transport simulation over a prescribed time interval.
 
   This is the main entrypoint for running a TORAX simulation.
@@ -753,11 +768,17 @@ def run_simulation(
       every step.
     spectator: Object which can "spectate" values as the simulation runs. See
       the Spectator class docstring for more details.
+    keep_state_history: If False, only the starting state and the latest state
+      are held in memory while stepping, rather than one state per time step.
+      Memory use then no longer grows with the number of steps. Use a
+      spectator to record any values needed from the intermediate steps.
 
   Returns:
-    tuple of ToraxSimState objects, one for each time step. There are N+1
+    Sequence of ToraxSimState objects, one for each time step. There are N+1
     objects returned, where N is the number of simulation steps taken. The first
-    object in the tuple is for the initial state.
+    object in the sequence is for the initial state. This is the list the states
+    were collected in while stepping, not a copy of it. If keep_state_history is
+    False, only the initial and final states are returned.
   """
 
   # Provide logging information on precision setting
@@ -771,9 +792,22 @@ def run_simulation(
   # Not efficient for grad, jit of grad.
   # Uses time_step_calculator.not_done to decide when to stop.
   # Note: can't use a jax while loop due to appending to history.
-
-  running_main_loop_start_time = time.time()
-  wall_clock_step_times = []
+  # Nor can the loop be a jax.lax.scan over a maximum number of steps: the
+  # step_fn itself makes Python-level decisions on device values (e.g. the NaN
+  # check on dt and the adaptive dt backtracking), the spectator observes each
+  # step on the host, and the runtime params may be updated between steps. The
+  # host syncs these need happen once per step anyway.
+  # The input state's buffers are not donated to the step either: each state is
+  # still referenced by the history (the starting state even when the history
+  # is not kept) and by the spectator, and the CPU backend ignores donation.
+
+  running_main_loop_start_time = time.perf_counter()
+  # Wall clock time of the first step, and the running mean and sum of squared
+  # deviations (Welford's algorithm) of the wall clock times of the later steps.
+  first_step_time = None
+  num_later_steps = 0
+  later_steps_mean_time = 0.0
+  later_steps_m2 = 0.0
   torax_outputs = [
       initial_state,
   ]
@@ -798,18 +832,23 @@ def run_simulation(
     # iteration, we need to start the spectator before step here.
     spectator.before_step()
 
+  not_done = _get_not_done_fn(time_step_calculator)
+
   sim_state = initial_state
   # Keep advancing the simulation until the time_step_calculator tells us we are
   # done.
-  while time_step_calculator.not_done(
-      sim_state.t,
-      dynamic_runtime_params_slice,
-      sim_state.time_step_calculator_state,
-  ):
+  while not_done(sim_state, dynamic_runtime_params_slice):
     # Measure how long in wall clock time each simulation step takes.
-    step_start_time = time.time()
+    step_start_time = time.perf_counter()
     if log_timestep_info:
-      _log_timestep(sim_state.t, sim_state.dt, sim_state.stepper_iterations)
+      # Fetch everything that is logged with a single device to host transfer.
+      t, dt, stepper_iterations, stepper_error_state = jax.device_get((
+          sim_state.t,
+          sim_state.dt,
+          sim_state.stepper_iterations,
+          stepper_error_state,
+      ))
+      _log_timestep(t, dt, stepper_iterations)
       # TODO(b/330172917): once tol and coarse_tol are configurable in the
       # runtime_params, also log the value of tol and coarse_tol below
       match stepper_error_state:
@@ -864,13 +903,26 @@ def run_simulation(
     dynamic_runtime_params_slice = dynamic_runtime_params_slice_provider(
         sim_state.t, geo=geo,
     )
-    geo = geometry_provider(sim_state.t)
-    torax_outputs.append(sim_state)
-    wall_clock_step_times.append(time.time() - step_start_time)
+    if keep_state_history or len(torax_outputs) == 1:
+      torax_outputs.append(sim_state)
+    else:
+      torax_outputs[-1] = sim_state
+    step_time = time.perf_counter() - step_start_time
+    if first_step_time is None:
+      first_step_time = step_time
+    else:
+      num_later_steps += 1
+      delta = step_time - later_steps_mean_time
+      later_steps_mean_time += delta / num_later_steps
+      later_steps_m2 += delta * (step_time - later_steps_mean_time)
   # Log final timestep
   if log_timestep_info:
     # The "sim_state" here has been updated by the loop above.
-    _log_timestep(sim_state.t, sim_state.dt, sim_state.stepper_iterations)
+    _log_timestep(
+        *jax.device_get(
+            (sim_state.t, sim_state.dt, sim_state.stepper_iterations)
+        )
+    )
 
   # Update the final time step's source profiles based on the explicit source
   # profiles computed based on the final state.
@@ -896,9 +948,12 @@ def run_simulation(
   # If the first step of the simulation was very long, call it out. It might
   # have to do with tracing the jitted step_fn.
   std_devs = 2  # Check if the first step is more than 2 std devs longer.
-  if wall_clock_step_times and wall_clock_step_times[0] > (
-      np.mean(wall_clock_step_times)
-      + std_devs * np.std(wall_clock_step_times)
+  if num_later_steps > 1:
+    later_steps_std_time = math.sqrt(later_steps_m2 / (num_later_steps - 1))
+  else:
+    later_steps_std_time = 0.0
+  if num_later_steps and first_step_time > (
+      later_steps_mean_time + std_devs * later_steps_std_time
   ):
     long_first_step = True
     logging.info(
@@ -906,22 +961,66 @@ def run_simulation(
         ' It likely was tracing and compiling the step_fn. It took %.2f '
         'seconds of wall clock time.',
         std_devs,
-        wall_clock_step_times[0],
+        first_step_time,
     )
   else:
     long_first_step = False
 
-  wall_clock_time_elapsed = time.time() - running_main_loop_start_time
+  wall_clock_time_elapsed = time.perf_counter() - running_main_loop_start_time
   simulation_time = torax_outputs[-1].t - torax_outputs[0].t
   if long_first_step:
     # Don't include the long first step in the total time logged.
-    wall_clock_time_elapsed -= wall_clock_step_times[0]
+    wall_clock_time_elapsed -= first_step_time
   logging.info(
       'Simulated %.2f seconds of physics in %.2f seconds of wall clock time.',
       simulation_time,
       wall_clock_time_elapsed,
   )
-  return tuple(torax_outputs)
+  return torax_outputs
+
+
+def _get_not_done_fn(
+    time_step_calculator: ts.TimeStepCalculator,
+) -> Callable[
+    [state.ToraxSimState, runtime_params_slice.DynamicRuntimeParamsSlice], bool
+]:
+  """Returns the predicate deciding whether run_simulation should keep going.
+
+  The chi and fixed time step calculators are done once t reaches t_final, so
+  for them each check compares t with the t_final of the current slice on the
+  host. This only transfers t, instead of dispatching a comparison op to the
+  device on every step and then transferring its result. Other time step
+  calculators use their own not_done.
+
+  Args:
+    time_step_calculator: Time step calculator of the simulation.
+
+  Returns:
+    Function of the current state and slice, returning True while the
+    simulation is not done.
+  """
+  if type(time_step_calculator).not_done not in (
+      chi_time_step_calculator.ChiTimeStepCalculator.not_done,
+      fixed_time_step_calculator.FixedTimeStepCalculator.not_done,
+  ):
+    return lambda sim_state, dynamic_runtime_params_slice: (
+        time_step_calculator.not_done(
+            sim_state.t,
+            dynamic_runtime_params_slice,
+            sim_state.time_step_calculator_state,
+        )
+    )
+
+  def not_done(
+      sim_state: state.ToraxSimState,
+      dynamic_runtime_params_slice: runtime_params_slice.DynamicRuntimeParamsSlice,
+  ) -> bool:
+    t = jax.device_get(sim_state.t)
+    # Compare in the dtype of t, as the comparison on the device would.
+    t_final = t.dtype.type(dynamic_runtime_params_slice.numerics.t_final)
+    return bool(t < t_final)
+
+  return not_done
 
 
 def _update_spectator(
@@ -1066,6 +1165,83 @@ def provide_core_profiles_t_plus_dt(
     core_profiles_t: state.CoreProfiles,
 ) -> state.CoreProfiles:
   """Provides state at t_plus_dt with new boundary conditions and prescribed profiles."""
+  # The prescribed profile updates branch in Python on these flags, so they
+  # select between separately jitted variants rather than being traced.
+  return _provide_core_profiles_t_plus_dt(
+      static_runtime_params_slice=static_runtime_params_slice,
+      dynamic_runtime_params_slice_t_plus_dt=dynamic_runtime_params_slice_t_plus_dt,
+      geo_t_plus_dt=geo_t_plus_dt,
+      core_profiles_t=core_profiles_t,
+      enable_prescribed_profile_evolution=bool(
+          dynamic_runtime_params_slice_t_plus_dt.numerics.enable_prescribed_profile_evolution
+      ),
+      normalize_to_nbar=bool(
+          dynamic_runtime_params_slice_t_plus_dt.profile_conditions.normalize_to_nbar
+      ),
+  )
+
+
+@jax_utils.jit
+def _clip_dt_to_t_final(
+    t: jax.Array,
+    previous_dt: jax.Array,
+    dt: jax.Array,
+    t_final: jax.Array,
+    exact_t_final: jax.Array,
+) -> tuple[jax.Array, jax.Array]:
+  """Shortens dt to end exactly at t_final if requested, and checks for NaN.
+
+  The clipping and the NaN check are fused into a single compiled function so
+  that the step only dispatches once and syncs once with the host on the check.
+
+  Args:
+    t: Time at the start of the step.
+    previous_dt: dt of the previous step.
+    dt: dt proposed by the time step calculator.
+    t_final: Final time of the simulation.
+    exact_t_final: Whether the simulation should end exactly at t_final.
+
+  Returns:
+    Tuple of the dt to use and whether it is NaN.
+  """
+  crosses_t_final = (t < t_final) * (t + previous_dt > t_final)
+  dt = jnp.where(
+      jnp.logical_and(exact_t_final, crosses_t_final),
+      t_final - t,
+      dt,
+  )
+  return dt, jnp.any(jnp.isnan(dt))
+
+
+@functools.partial(
+    jax_utils.jit,
+    static_argnames=[
+        'static_runtime_params_slice',
+        'enable_prescribed_profile_evolution',
+        'normalize_to_nbar',
+    ],
+)
+def _provide_core_profiles_t_plus_dt(
+    static_runtime_params_slice: runtime_params_slice.StaticRuntimeParamsSlice,
+    dynamic_runtime_params_slice_t_plus_dt: runtime_params_slice.DynamicRuntimeParamsSlice,
+    geo_t_plus_dt: geometry.Geometry,
+    core_profiles_t: state.CoreProfiles,
+    enable_prescribed_profile_evolution: bool,
+    normalize_to_nbar: bool,
+) -> state.CoreProfiles:
+  """Jitted implementation of provide_core_profiles_t_plus_dt."""
+  # Put the static flags back in place of their traced copies.
+  dynamic_runtime_params_slice_t_plus_dt = dataclasses.replace(
+      dynamic_runtime_params_slice_t_plus_dt,
+      numerics=dataclasses.replace(
+          dynamic_runtime_params_slice_t_plus_dt.numerics,
+          enable_prescribed_profile_evolution=enable_prescribed_profile_evolution,
+      ),
+      profile_conditions=dataclasses.replace(
+          dynamic_runtime_params_slice_t_plus_dt.profile_conditions,
+          normalize_to_nbar=normalize_to_nbar,
+      ),
+  )
   updated_boundary_conditions = (
       core_profile_setters.compute_boundary_conditions(
           dynamic_runtime_params_slice_t_plus_dt,
@@ -44,7 +44,7 @@ import datetime
 import enum
 import os
 import sys
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
 
 from absl import logging
 import chex
@@ -169,7 +169,7 @@ def _translate_leaf_with_path(
 
 
 def simulation_output_to_xr(
-    torax_outputs: tuple[state_lib.ToraxSimState, ...],
+    torax_outputs: Sequence[state_lib.ToraxSimState],
     geo: torax.Geometry,
 ) -> xr.Dataset:
   """Build an xr.Dataset of the simulation output."""
@@ -191,9 +191,9 @@ def simulation_output_to_xr(
   }
 
   core_profile_history, core_sources_history, core_transport_history = (
-      state_lib.build_history_from_states(torax_outputs)
+      state_lib.build_history_from_states(torax_outputs, on_host=True)
   )
-  t = state_lib.build_time_history_from_states(torax_outputs)
+  t = state_lib.build_time_history_from_states(torax_outputs, on_host=True)
   chex.assert_rank(t, 1)
 
   # Get the coordinate variables for dimensions ("time", "rho_face", "rho_cell")
@@ -208,10 +208,14 @@ def simulation_output_to_xr(
   # Build a PyTree of variables we will want to log.
   tree = (core_profile_history, core_transport_history, core_sources_history)
 
-  # Only try to log arrays.
-  leaves_with_path = jax.tree_util.tree_leaves_with_path(
-      tree, is_leaf=lambda x: isinstance(x, jax.Array)
-  )
+  # Only try to log arrays, and skip the excluded ones.
+  leaves_with_path = [
+      (path, leaf)
+      for path, leaf in jax.tree_util.tree_leaves_with_path(
+          tree, is_leaf=lambda x: isinstance(x, jax.Array)
+      )
+      if _path_to_name(path) not in exclude_set
+  ]
 
   # Initialize dict with desired geometry and reference variables
   xr_dict = {
@@ -228,7 +232,7 @@ def simulation_output_to_xr(
   # Extend with desired core_profiles, core_sources, core_transport variables
   for path, leaf in leaves_with_path:
     name, da = _translate_leaf_with_path(time, geo, path, leaf)
-    if da is not None and name not in exclude_set:
+    if da is not None:
       xr_dict[name] = da
   ds = xr.Dataset(
       xr_dict,
@@ -409,6 +413,7 @@ def main(
           pyplot_figure_kwargs=dict(
               figsize=(12, 6),
           ),
+          min_refresh_interval=0.25,
       )
       plt.show()
     else:
@@ -422,6 +427,9 @@ def main(
       log_timestep_info=log_sim_progress,
       spectator=spectator,
   )
+  if spectator is not None:
+    # The last steps may have been skipped by the throttled refresh.
+    spectator.update_plots()
   log_to_stdout('Finished running simulation.', color=AnsiColors.GREEN)
 
   ds = simulation_output_to_xr(torax_outputs, geo)
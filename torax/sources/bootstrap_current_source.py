@@ -17,8 +17,10 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 
 import chex
+import jax
 from jax import numpy as jnp
 from jax.scipy import integrate
 from torax import constants
@@ -182,6 +184,48 @@ class BootstrapCurrentSource(source.Source):
     )
 
 
+def _get_geometry_terms(
+    geo: geometry.Geometry,
+) -> tuple[jnp.ndarray, jnp.ndarray]:
+  """Returns the terms of the Sauter model which only depend on the geometry.
+
+  These are evaluated once per geometry when the geometry is concrete (e.g.
+  with TORAX_COMPILATION_ENABLED=False, where this runs on every step with the
+  same geometry). Under jit they are computed inline.
+
+  Args:
+    geo: Torus geometry.
+
+  Returns:
+    Tuple of (epsilon + eps)**1.5 and the trapped particle fraction, where
+    epsilon is the local inverse aspect ratio on the face grid.
+  """
+  if isinstance(geo.Rout_face, jax.core.Tracer):
+    return _calc_geometry_terms(geo)
+  return _calc_geometry_terms_cached(geo)
+
+
+def _calc_geometry_terms(
+    geo: geometry.Geometry,
+) -> tuple[jnp.ndarray, jnp.ndarray]:
+  """See _get_geometry_terms."""
+  # # local r/R0 on face grid
+  epsilon = (geo.Rout_face - geo.Rin_face) / (geo.Rout_face + geo.Rin_face)
+  epseff = (
+      0.67 * (1.0 - 1.4 * jnp.abs(geo.delta_face) * geo.delta_face) * epsilon
+  )
+  aa = (1.0 - epsilon) / (1.0 + epsilon)
+  ftrap = 1.0 - jnp.sqrt(aa) * (1.0 - epseff) / (1.0 + 2.0 * jnp.sqrt(epseff))
+  return (epsilon + constants.CONSTANTS.eps) ** 1.5, ftrap
+
+
+# Geometries are hashed and compared by identity, so this holds on to the terms
+# of the last few geometry objects used.
+_calc_geometry_terms_cached = functools.lru_cache(maxsize=2)(
+    _calc_geometry_terms
+)
+
+
 @jax_utils.jit
 def calc_neoclassical(
     dynamic_runtime_params_slice: runtime_params_slice.DynamicRuntimeParamsSlice,
@@ -223,13 +267,7 @@ def calc_neoclassical(
   true_ni_face = ni.face_value() * dynamic_runtime_params_slice.numerics.nref
   Zeff = dynamic_runtime_params_slice.plasma_composition.Zeff
 
-  # # local r/R0 on face grid
-  epsilon = (geo.Rout_face - geo.Rin_face) / (geo.Rout_face + geo.Rin_face)
-  epseff = (
-      0.67 * (1.0 - 1.4 * jnp.abs(geo.delta_face) * geo.delta_face) * epsilon
-  )
-  aa = (1.0 - epsilon) / (1.0 + epsilon)
-  ftrap = 1.0 - jnp.sqrt(aa) * (1.0 - epseff) / (1.0 + 2.0 * jnp.sqrt(epseff))
+  epsilon_pow_1_5, ftrap = _get_geometry_terms(geo)
 
   # Spitzer conductivity
   NZ = 0.58 + 0.74 / (0.76 + Zeff)
@@ -260,10 +298,7 @@ def calc_neoclassical(
       * true_ne_face
       * Zeff
       * lnLame
-      / (
-          ((temp_el.face_value() * 1e3) ** 2)
-          * (epsilon + constants.CONSTANTS.eps) ** 1.5
-      )
+      / (((temp_el.face_value() * 1e3) ** 2) * epsilon_pow_1_5)
   )
   nuistar = (
       4.9e-18
@@ -272,10 +307,7 @@ def calc_neoclassical(
       * true_ni_face
       * Zeff**4
       * lnLami
-      / (
-          ((temp_ion.face_value() * 1e3) ** 2)
-          * (epsilon + constants.CONSTANTS.eps) ** 1.5
-      )
+      / (((temp_ion.face_value() * 1e3) ** 2) * epsilon_pow_1_5)
   )
 
   # Neoclassical correction to spitzer conductivity
@@ -63,6 +63,12 @@ SourceOutputShapeFunction = Callable[
 ]
 
 
+# Values of the modes compared against on every source evaluation, looked up
+# once rather than through the enum on every call.
+_MODEL_BASED = runtime_params_lib.Mode.MODEL_BASED.value
+_FORMULA_BASED = runtime_params_lib.Mode.FORMULA_BASED.value
+
+
 def get_cell_profile_shape(
     geo: geometry.Geometry,
 ):
@@ -162,11 +168,13 @@ class Source:
   ) -> jnp.ndarray:
     """Returns whether the source type is supported."""
     mode = jnp.array(mode)
+    # Compare against all of the supported values at once, rather than
+    # building one comparison per supported mode.
     return jnp.any(
-        jnp.bool_([
-            supported_mode.value == mode
-            for supported_mode in self.supported_modes
-        ])
+        mode
+        == jnp.array(
+            [supported_mode.value for supported_mode in self.supported_modes]
+        )
     )
 
   def _unsupported_mode_error_msg(
@@ -467,7 +475,7 @@ def get_source_profiles(
   zeros = jnp.zeros(output_shape)
   output = jnp.zeros(output_shape)
   output += jnp.where(
-      mode == runtime_params_lib.Mode.MODEL_BASED.value,
+      mode == _MODEL_BASED,
       model_func(
           dynamic_runtime_params_slice,
           dynamic_source_runtime_params,
@@ -477,7 +485,7 @@ def get_source_profiles(
       zeros,
   )
   output += jnp.where(
-      mode == runtime_params_lib.Mode.FORMULA_BASED.value,
+      mode == _FORMULA_BASED,
       formula(
           dynamic_runtime_params_slice,
           dynamic_source_runtime_params,
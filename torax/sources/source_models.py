@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import dataclasses
 import functools
+from typing import Any
 
 import jax.numpy as jnp
 from torax import constants
@@ -692,6 +693,8 @@ class SourceModels:
     self._ne_sources: dict[str, source_lib.Source] = {}
     self._temp_ion_sources: dict[str, source_lib.Source] = {}
     self._temp_el_sources: dict[str, source_lib.Source] = {}
+    # Sources which output both the ion and electron heat profiles, stacked.
+    self._ion_el_sources: dict[str, source_lib.Source] = {}
 
     # First set the "special" sources.
     for source_name, source in sources.items():
@@ -783,6 +786,11 @@ class SourceModels:
       self._temp_ion_sources[source_name] = source
     if source_lib.AffectedCoreProfile.TEMP_EL in source.affected_core_profiles:
       self._temp_el_sources[source_name] = source
+    if source.affected_core_profiles == (
+        source_lib.AffectedCoreProfile.TEMP_ION,
+        source_lib.AffectedCoreProfile.TEMP_EL,
+    ):
+      self._ion_el_sources[source_name] = source
 
   # Some sources require direct access, so this class defines properties for
   # those sources.
@@ -833,15 +841,7 @@ class SourceModels:
   @property
   def ion_el_sources(self) -> dict[str, source_lib.Source]:
     """Returns all source models which output both ion and el temp profiles."""
-    return {
-        name: source
-        for name, source in self._standard_sources.items()
-        if source.affected_core_profiles
-        == (
-            source_lib.AffectedCoreProfile.TEMP_ION,
-            source_lib.AffectedCoreProfile.TEMP_EL,
-        )
-    }
+    return self._ion_el_sources
 
   @property
   def standard_sources(self) -> dict[str, source_lib.Source]:
@@ -864,7 +864,11 @@ class SourceModels:
 class SourceModelsBuilder:
   """Builds a SourceModels and also holds its runtime_params.
 
-  The SourceModels is a collection of many smaller Source models.
+  The SourceModels is a collection of many smaller Source models. Each call
+  returns a new SourceModels, but the Sources which do not link back to it are
+  reused until a source builder is added, removed or has a field other than its
+  runtime_params replaced. In-place changes to the fields of a source builder
+  are not detected: replace the field (or the builder) instead.
 
   Attributes:
     source_builders: Dict mapping the name of each Source to its builder.
@@ -926,27 +930,65 @@ class SourceModelsBuilder:
       )
 
     self.source_builders = source_builders
+    self._runtime_params: dict[str, runtime_params_lib.RuntimeParams] = {}
+    self._unlinked_sources: (
+        tuple[tuple[Any, ...], dict[str, source_lib.Source]] | None
+    ) = None
 
   def __call__(self) -> SourceModels:
+    # The runtime params are the part of the builders which usually changes
+    # between runs, and the built Sources do not depend on them. So reuse the
+    # Sources built last time unless a builder was added, removed or had another
+    # field replaced.
+    builders_snapshot = self._builders_snapshot()
+    if self._unlinked_sources is None or not _all_identical(
+        self._unlinked_sources[0], builders_snapshot
+    ):
+      self._unlinked_sources = (
+          builders_snapshot,
+          {
+              name: builder()
+              for name, builder in self.source_builders.items()
+              if not builder.links_back
+          },
+      )
 
-    unlinked_sources = {
-        name: builder()
-        for name, builder in self.source_builders.items()
-        if not builder.links_back
-    }
-    initial_model = SourceModels(unlinked_sources)
+    initial_model = SourceModels(dict(self._unlinked_sources[1]))
     for name, builder in self.source_builders.items():
       if builder.links_back:
         initial_model.add_source(name, builder(initial_model))
     return initial_model
 
+  def _builders_snapshot(self) -> tuple[Any, ...]:
+    """Returns the builders and their fields other than the runtime params."""
+    snapshot = []
+    for name, builder in self.source_builders.items():
+      snapshot.append(name)
+      snapshot.append(builder)
+      for field in dataclasses.fields(builder):
+        if field.name != 'runtime_params':
+          snapshot.append(getattr(builder, field.name))
+    return tuple(snapshot)
+
   @property
   def runtime_params(self) -> dict[str, runtime_params_lib.RuntimeParams]:
     """Returns all the runtime params for all sources."""
-    return {
-        source_name: builder.runtime_params
+    # This is called every time a DynamicRuntimeParamsSlice is built, so return
+    # the same dict for as long as the builders and their runtime params are
+    # unchanged instead of allocating a new one per call.
+    if len(self._runtime_params) != len(self.source_builders) or any(
+        self._runtime_params.get(source_name) is not builder.runtime_params
         for source_name, builder in self.source_builders.items()
-    }
+    ):
+      self._runtime_params = {
+          source_name: builder.runtime_params
+          for source_name, builder in self.source_builders.items()
+      }
+    return self._runtime_params
+
+
+def _all_identical(a: tuple[Any, ...], b: tuple[Any, ...]) -> bool:
+  return len(a) == len(b) and all(x is y for x, y in zip(a, b))
 
 
 def build_all_zero_profiles(
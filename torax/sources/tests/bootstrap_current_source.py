@@ -46,7 +46,7 @@ class BootstrapCurrentSourceTest(test_lib.SourceTestCase):
   def test_source_value(self):
     source_builder = bootstrap_current_source.BootstrapCurrentSourceBuilder()
     runtime_params = general_runtime_params.GeneralRuntimeParams()
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     source_models_builder = source_models_lib.SourceModelsBuilder(
         {'j_bootstrap': source_builder}
     )
@@ -87,7 +87,7 @@ class BootstrapCurrentSourceTest(test_lib.SourceTestCase):
   def test_extraction_of_relevant_profile_from_output(self):
     """Tests that the relevant profile is extracted from the output."""
     source = bootstrap_current_source.BootstrapCurrentSource()
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     cell = source_lib.ProfileType.CELL.get_profile_shape(geo)
     face = source_lib.ProfileType.FACE.get_profile_shape(geo)
     fake_profile = source_profiles.BootstrapCurrentProfile(
@@ -114,6 +114,18 @@ class BootstrapCurrentSourceTest(test_lib.SourceTestCase):
         jnp.zeros(cell),
     )
 
+  def test_geometry_terms_are_computed_once_per_concrete_geometry(self):
+    """Tests the geometry-only Sauter terms are cached per geometry."""
+    geo = geometry.build_circular_geometry()
+    terms = bootstrap_current_source._get_geometry_terms(geo)
+    self.assertIs(bootstrap_current_source._get_geometry_terms(geo), terms)
+    other_terms = bootstrap_current_source._get_geometry_terms(
+        geometry.build_circular_geometry()
+    )
+    self.assertIsNot(other_terms, terms)
+    for term, other_term in zip(terms, other_terms):
+      np.testing.assert_allclose(term, other_term)
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -43,6 +43,10 @@ class BremsstrahlungHeatSinkTest(test_lib.SingleProfileSourceTestCase):
         ],
         expected_affected_core_profiles=(source.AffectedCoreProfile.TEMP_EL,),
     )
+    # The default source models do not depend on the references, so build
+    # them once for all the parameterized cases below.
+    cls._source_models_builder = source_models_lib.SourceModelsBuilder()
+    cls._source_models = cls._source_models_builder()
 
   @parameterized.parameters([
       dict(references_getter=torax_refs.circular_references),
@@ -59,18 +63,16 @@ class BremsstrahlungHeatSinkTest(test_lib.SingleProfileSourceTestCase):
     runtime_params = references.runtime_params
     geo = references.geo
 
-    source_models_builder = source_models_lib.SourceModelsBuilder()
     dynamic_runtime_params_slice = (
         runtime_params_slice.build_dynamic_runtime_params_slice(
             runtime_params,
-            sources=source_models_builder.runtime_params,
+            sources=self._source_models_builder.runtime_params,
         )
     )
-    source_models = source_models_builder()
     core_profiles = core_profile_setters.initial_core_profiles(
         dynamic_runtime_params_slice=dynamic_runtime_params_slice,
         geo=geo,
-        source_models=source_models,
+        source_models=self._source_models,
     )
 
     P_brem_total, P_brems_profile = (
@@ -18,7 +18,6 @@ from absl.testing import absltest
 import jax
 import jax.numpy as jnp
 import numpy as np
-from torax import geometry
 from torax.config import runtime_params as general_runtime_params
 from torax.config import runtime_params_slice
 from torax.sources import external_current_source
@@ -47,7 +46,7 @@ class ExternalCurrentSourceTest(test_lib.SourceTestCase):
     source = source_builder()
     runtime_params = general_runtime_params.GeneralRuntimeParams()
     # Must be circular for jext_hires call.
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     dynamic_slice = runtime_params_slice.build_dynamic_runtime_params_slice(
         runtime_params,
         sources={
@@ -74,7 +73,7 @@ class ExternalCurrentSourceTest(test_lib.SourceTestCase):
 
   def test_invalid_source_types_raise_errors(self):
     runtime_params = general_runtime_params.GeneralRuntimeParams()
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     source_builder = external_current_source.ExternalCurrentSourceBuilder()
     source = source_builder()
     for unsupported_mode in self._unsupported_modes:
@@ -98,7 +97,7 @@ class ExternalCurrentSourceTest(test_lib.SourceTestCase):
 
   def test_extraction_of_relevant_profile_from_output(self):
     """Tests that the relevant profile is extracted from the output."""
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     source = external_current_source.ExternalCurrentSource()
     cell = source_lib.ProfileType.CELL.get_profile_shape(geo)
     fake_profile = (jnp.ones(cell), jnp.zeros(cell))
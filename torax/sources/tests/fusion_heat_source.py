@@ -18,6 +18,8 @@ from typing import Callable
 
 from absl.testing import absltest
 from absl.testing import parameterized
+import jax
+import jax.numpy as jnp
 import numpy as np
 from torax import constants
 from torax import core_profile_setters
@@ -29,6 +31,62 @@ from torax.sources import source_models as source_models_lib
 from torax.sources.tests import test_lib
 from torax.tests.test_lib import torax_refs
 
+# Constants of the PINT reference fusion power calculation below, evaluated
+# once at import. <sigma*v> for DT uses the Bosch-Hale parameterization NF 1992.
+_EFUS = 17.6 * 1e3 * constants.CONSTANTS.keV2J
+_MRC2 = 1124656
+_BG = 34.3827
+_C1 = 1.17302e-9
+_C2 = 1.51361e-2
+_C3 = 7.51886e-2
+_C4 = 4.60643e-3
+_C5 = 1.35e-2
+_C6 = -1.0675e-4
+_C7 = 1.366e-5
+
+
+@jax.jit
+def _calculate_fusion(T, ni, nref, vpr_face, r_face):  # pylint: disable=invalid-name
+  """Reference implementation from PINT.
+
+  PINT doesn't follow Google style, hence the variable names.
+
+  This is jitted so that all the parameterized test cases share one compiled
+  reference calculation, rather than running it op by op.
+
+  Args:
+    T: Ion temperature on the face grid [keV].
+    ni: Main ion density on the face grid, in units of nref.
+    nref: Reference density [m^-3].
+    vpr_face: dV/dr on the face grid.
+    r_face: Face grid.
+
+  Returns:
+    Ptot: Fusion power [MW].
+  """
+  # P [W/m^3] = Efus *1/4 * n^2 * <sigma*v>.
+  # <sigma*v> for DT calculated with the Bosch-Hale parameterization
+  # NF 1992.
+  # T is in keV for the formula
+
+  theta = T / (
+      1
+      - (T * (_C2 + T * (_C4 + T * _C6)))
+      / (1 + T * (_C3 + T * (_C5 + T * _C7)))
+  )
+  xi = (_BG**2 / (4 * theta)) ** (1 / 3)
+  sigmav = (
+      _C1 * theta * jnp.sqrt(xi / (_MRC2 * T**3)) * jnp.exp(-3 * xi) / 1e6
+  )  # units of m^3/s
+
+  Pfus = _EFUS * 0.25 * (ni * nref) ** 2 * sigmav  # [W/m^3]
+  # Trapezoid rule as a single dot product with pre-weighted volumes.
+  dr = jnp.diff(r_face)
+  weights = 0.5 * jnp.concatenate((dr[:1], dr[:-1] + dr[1:], dr[-1:]))
+  Ptot = (weights * vpr_face) @ Pfus / 1e6  # [MW]
+
+  return Ptot
+
 
 class FusionHeatSourceTest(test_lib.IonElSourceTestCase):
   """Tests for FusionHeatSource."""
@@ -46,6 +104,10 @@ class FusionHeatSourceTest(test_lib.IonElSourceTestCase):
             source.AffectedCoreProfile.TEMP_EL,
         ),
     )
+    # The default source models do not depend on the references, so build
+    # them once for all the parameterized cases below.
+    cls._source_models_builder = source_models_lib.SourceModelsBuilder()
+    cls._source_models = cls._source_models_builder()
 
   @parameterized.parameters([
       dict(references_getter=torax_refs.circular_references),
@@ -64,19 +126,17 @@ class FusionHeatSourceTest(test_lib.IonElSourceTestCase):
     geo = references.geo
     nref = runtime_params.numerics.nref
 
-    source_models_builder = source_models_lib.SourceModelsBuilder()
     dynamic_runtime_params_slice = (
         runtime_params_slice.build_dynamic_runtime_params_slice(
             runtime_params,
-            sources=source_models_builder.runtime_params,
+            sources=self._source_models_builder.runtime_params,
             geo=geo,
         )
     )
-    source_models = source_models_builder()
     core_profiles = core_profile_setters.initial_core_profiles(
         dynamic_runtime_params_slice=dynamic_runtime_params_slice,
         geo=geo,
-        source_models=source_models,
+        source_models=self._source_models,
     )
 
     fusion_jax, _, _ = fusion_heat_source.calc_fusion(
@@ -85,49 +145,13 @@ class FusionHeatSourceTest(test_lib.IonElSourceTestCase):
         nref,
     )
 
-    def calculate_fusion(runtime_params, geo, core_profiles):
-      """Reference implementation from PINT. We still use TORAX state here."""
-      # PINT doesn't follow Google style
-      # pylint:disable=invalid-name
-      T = core_profiles.temp_ion.face_value()
-      consts = constants.CONSTANTS
-
-      # P [W/m^3] = Efus *1/4 * n^2 * <sigma*v>.
-      # <sigma*v> for DT calculated with the Bosch-Hale parameterization
-      # NF 1992.
-      # T is in keV for the formula
-
-      Efus = 17.6 * 1e3 * consts.keV2J
-      mrc2 = 1124656
-      BG = 34.3827
-      C1 = 1.17302e-9
-      C2 = 1.51361e-2
-      C3 = 7.51886e-2
-      C4 = 4.60643e-3
-      C5 = 1.35e-2
-      C6 = -1.0675e-4
-      C7 = 1.366e-5
-
-      theta = T / (
-          1
-          - (T * (C2 + T * (C4 + T * C6))) / (1 + T * (C3 + T * (C5 + T * C7)))
-      )
-      xi = (BG**2 / (4 * theta)) ** (1 / 3)
-      sigmav = (
-          C1 * theta * np.sqrt(xi / (mrc2 * T**3)) * np.exp(-3 * xi) / 1e6
-      )  # units of m^3/s
-
-      Pfus = (
-          Efus
-          * 0.25
-          * (core_profiles.ni.face_value() * runtime_params.numerics.nref) ** 2
-          * sigmav
-      )  # [W/m^3]
-      Ptot = np.trapz(Pfus * geo.vpr_face, geo.r_face) / 1e6  # [MW]
-
-      return Ptot
-
-    fusion_pint = calculate_fusion(runtime_params, geo, core_profiles)
+    fusion_pint = _calculate_fusion(
+        core_profiles.temp_ion.face_value(),
+        core_profiles.ni.face_value(),
+        runtime_params.numerics.nref,
+        geo.vpr_face,
+        geo.r_face,
+    )
 
     np.testing.assert_allclose(fusion_jax, fusion_pint)
 
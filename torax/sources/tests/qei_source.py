@@ -18,7 +18,6 @@ import dataclasses
 from absl.testing import absltest
 import jax
 from torax import core_profile_setters
-from torax import geometry
 from torax.config import runtime_params as general_runtime_params
 from torax.config import runtime_params_slice
 from torax.sources import qei_source
@@ -54,7 +53,7 @@ class QeiSourceTest(test_lib.SourceTestCase):
     source_models = source_models_builder()
     source = source_models.sources['qei_source']
     runtime_params = general_runtime_params.GeneralRuntimeParams()
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     static_slice = runtime_params_slice.build_static_runtime_params_slice(
         runtime_params
     )
@@ -86,7 +85,7 @@ class QeiSourceTest(test_lib.SourceTestCase):
     source_models = source_models_builder()
     source = source_models.sources['qei_source']
     runtime_params = general_runtime_params.GeneralRuntimeParams()
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     static_slice = runtime_params_slice.build_static_runtime_params_slice(
         runtime_params
     )
@@ -258,6 +258,66 @@ class SourceProfilesTest(parameterized.TestCase):
     with self.assertRaises(ValueError):
       source_models.add_source(source_name, foo_source)
 
+  def test_ion_el_sources_are_tracked_when_added(self):
+    """Tests that ion_el_sources includes sources added after init."""
+    ion_el_source = source_lib.Source(
+        affected_core_profiles=(
+            source_lib.AffectedCoreProfile.TEMP_ION,
+            source_lib.AffectedCoreProfile.TEMP_EL,
+        ),
+        supported_modes=(runtime_params_lib.Mode.ZERO,),
+    )
+    el_source = source_lib.Source(
+        affected_core_profiles=(source_lib.AffectedCoreProfile.TEMP_EL,),
+        supported_modes=(runtime_params_lib.Mode.ZERO,),
+    )
+    source_models = source_models_lib.SourceModels(
+        sources={'ion_el': ion_el_source, 'el': el_source},
+    )
+    self.assertEqual(list(source_models.ion_el_sources), ['ion_el'])
+    source_models.add_source('ion_el2', ion_el_source)
+    self.assertEqual(list(source_models.ion_el_sources), ['ion_el', 'ion_el2'])
+
+  def test_builder_runtime_params_are_reused_until_changed(self):
+    """Tests the builder only rebuilds its runtime params dict on changes."""
+    source_models_builder = source_models_lib.SourceModelsBuilder()
+    runtime_params = source_models_builder.runtime_params
+    self.assertIs(source_models_builder.runtime_params, runtime_params)
+    new_jext_params = external_current_source.RuntimeParams()
+    source_models_builder.source_builders['jext'].runtime_params = (
+        new_jext_params
+    )
+    self.assertIs(source_models_builder.runtime_params['jext'], new_jext_params)
+
+  def test_builder_reuses_sources_until_builders_change(self):
+    """Tests the Sources are only rebuilt when a builder changes."""
+    source_models_builder = source_models_lib.SourceModelsBuilder()
+    source_models = source_models_builder()
+    source_models_builder.source_builders['jext'].runtime_params = (
+        external_current_source.RuntimeParams()
+    )
+    rebuilt_source_models = source_models_builder()
+    self.assertIsNot(rebuilt_source_models, source_models)
+    self.assertIs(rebuilt_source_models.jext, source_models.jext)
+    source_models_builder.source_builders['jext'] = (
+        external_current_source.ExternalCurrentSourceBuilder()
+    )
+    self.assertIsNot(source_models_builder().jext, source_models.jext)
+
+  def test_adding_source_does_not_affect_later_builds(self):
+    """Tests a source added to a built SourceModels is not in later builds."""
+    source_models_builder = source_models_lib.SourceModelsBuilder()
+    source_models = source_models_builder()
+    source_models.add_source(
+        'foo',
+        source_lib.Source(
+            affected_core_profiles=(source_lib.AffectedCoreProfile.TEMP_EL,),
+            supported_modes=(runtime_params_lib.Mode.ZERO,),
+        ),
+    )
+    self.assertIn('foo', source_models.sources)
+    self.assertNotIn('foo', source_models_builder().sources)
+
 
 if __name__ == '__main__':
   absltest.main()
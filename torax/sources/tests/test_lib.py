@@ -61,6 +61,9 @@ class SourceTestCase(parameterized.TestCase):
     cls._source_class_builder = source_class_builder
     cls._unsupported_modes = unsupported_modes
     cls._expected_affected_core_profiles = expected_affected_core_profiles
+    # Building the geometry is expensive and the tests don't modify it, so
+    # share one between all the tests of the class.
+    cls._geo = geometry.build_circular_geometry()
 
   def test_expected_mesh_states(self):
     # Most Source subclasses should have default names and be instantiable
@@ -94,7 +97,7 @@ class SingleProfileSourceTestCase(SourceTestCase):
     source = source_models.sources['foo']
     source_builder.runtime_params.mode = source.supported_modes[0]
     self.assertIsInstance(source, source_lib.SingleProfileSource)
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     dynamic_runtime_params_slice = (
         runtime_params_slice.build_dynamic_runtime_params_slice(
             runtime_params=runtime_params,
@@ -120,7 +123,7 @@ class SingleProfileSourceTestCase(SourceTestCase):
   def test_invalid_source_types_raise_errors(self):
     """Tests that using unsupported types raises an error."""
     runtime_params = general_runtime_params.GeneralRuntimeParams()
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     # pylint: disable=missing-kwoa
     source_builder = self._source_class_builder()  # pytype: disable=missing-parameter
     # pylint: enable=missing-kwoa
@@ -144,20 +147,18 @@ class SingleProfileSourceTestCase(SourceTestCase):
     )
     for unsupported_mode in self._unsupported_modes:
       source_builder.runtime_params.mode = unsupported_mode
-      dynamic_runtime_params_slice = (
-          runtime_params_slice.build_dynamic_runtime_params_slice(
-              runtime_params=runtime_params,
-              sources=source_models_builder.runtime_params,
-              geo=geo,
+      # Only the source's own params read the mode, so there is no need to
+      # rebuild the whole slice for each mode.
+      dynamic_source_runtime_params = (
+          source_builder.runtime_params.build_dynamic_params(
+              runtime_params.numerics.t_initial
           )
       )
       with self.subTest(unsupported_mode.name):
         with self.assertRaises(jax.interpreters.xla.xe.XlaRuntimeError):
           source.get_value(
               dynamic_runtime_params_slice=dynamic_runtime_params_slice,
-              dynamic_source_runtime_params=dynamic_runtime_params_slice.sources[
-                  'foo'
-              ],
+              dynamic_source_runtime_params=dynamic_source_runtime_params,
               geo=geo,
               core_profiles=core_profiles,
           )
@@ -172,7 +173,7 @@ class IonElSourceTestCase(SourceTestCase):
     source_builder = self._source_class_builder()  # pytype: disable=missing-parameter
     # pylint: enable=missing-kwoa
     runtime_params = general_runtime_params.GeneralRuntimeParams()
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     source_models_builder = source_models_lib.SourceModelsBuilder(
         {'foo': source_builder},
     )
@@ -204,7 +205,7 @@ class IonElSourceTestCase(SourceTestCase):
   def test_invalid_source_types_raise_errors(self):
     """Tests that using unsupported types raises an error."""
     runtime_params = general_runtime_params.GeneralRuntimeParams()
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     # pylint: disable=missing-kwoa
     source_builder = self._source_class_builder()  # pytype: disable=missing-parameter
     # pylint: enable=missing-kwoa
@@ -228,27 +229,25 @@ class IonElSourceTestCase(SourceTestCase):
     )
     for unsupported_mode in self._unsupported_modes:
       source_builder.runtime_params.mode = unsupported_mode
-      dynamic_runtime_params_slice = (
-          runtime_params_slice.build_dynamic_runtime_params_slice(
-              runtime_params=runtime_params,
-              sources=source_models_builder.runtime_params,
-              geo=geo,
+      # Only the source's own params read the mode, so there is no need to
+      # rebuild the whole slice for each mode.
+      dynamic_source_runtime_params = (
+          source_builder.runtime_params.build_dynamic_params(
+              runtime_params.numerics.t_initial
           )
       )
       with self.subTest(unsupported_mode.name):
         with self.assertRaises(jax.interpreters.xla.xe.XlaRuntimeError):
           source.get_value(
               dynamic_runtime_params_slice=dynamic_runtime_params_slice,
-              dynamic_source_runtime_params=dynamic_runtime_params_slice.sources[
-                  'foo'
-              ],
+              dynamic_source_runtime_params=dynamic_source_runtime_params,
               geo=geo,
               core_profiles=core_profiles,
           )
 
   def test_extraction_of_relevant_profile_from_output(self):
     """Tests that the relevant profile is extracted from the output."""
-    geo = geometry.build_circular_geometry()
+    geo = self._geo
     # pylint: disable=missing-kwoa
     source = self._source_class()  # pytype: disable=missing-parameter
     # pylint: enable=missing-kwoa
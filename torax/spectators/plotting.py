@@ -16,6 +16,7 @@
 
 import dataclasses
 import math
+import time
 from typing import Any, Callable, Sequence
 
 from jax import numpy as jnp
@@ -168,6 +169,7 @@ class PlotSpectator(spectator.Spectator):
       plots: Sequence[Plot],
       pyplot_figure_kwargs: dict[str, Any] | None = None,
       max_plots_in_row: int = 2,
+      min_refresh_interval: float = 0.0,
   ):
     """Initializes the PlotSpectator.
 
@@ -180,6 +182,10 @@ class PlotSpectator(spectator.Spectator):
       pyplot_figure_kwargs: Extra kwargs to pass into the matplotlib Figure
         constructor.
       max_plots_in_row: Number of subplots to have in each row in the figure.
+      min_refresh_interval: Minimum wall clock time, in seconds, between two
+        redraws of the figure in after_step(). Steps finishing sooner than this
+        after the last redraw are still observed, but are not drawn. With the
+        default of 0, the figure is redrawn after every step.
     """
     self._spectator = spectator.InMemoryJaxArraySpectator()
     self._plotter = Plotter(
@@ -187,14 +193,28 @@ class PlotSpectator(spectator.Spectator):
         pyplot_figure_kwargs=pyplot_figure_kwargs,
         max_plots_in_row=max_plots_in_row,
     )
+    self._min_refresh_interval = min_refresh_interval
+    self._last_refresh_time = None
 
   def reset(self) -> None:
     """Resets the observed history and creates a new plot to plot on."""
     self._plotter.reset()
     self._spectator.reset()
+    self._last_refresh_time = None
 
   def after_step(self):
-    """Updates the figure shown and pauses for 10 ms."""
+    """Updates the figure shown and pauses for 10 ms.
+
+    Does nothing if the figure was last updated less than min_refresh_interval
+    seconds ago.
+    """
+    now = time.monotonic()
+    if (
+        self._last_refresh_time is not None
+        and now - self._last_refresh_time < self._min_refresh_interval
+    ):
+      return
+    self._last_refresh_time = now
     self.update_plots()
     plt.pause(0.01)
 
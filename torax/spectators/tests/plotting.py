@@ -64,6 +64,26 @@ class PlottingTest(parameterized.TestCase):
     )
     _run_sim_without_sources(runtime_params, geo, observer)
 
+  def test_plot_observer_throttles_refreshes(self):
+    geo = geometry.build_circular_geometry()
+    observer = plotting.PlotSpectator(
+        plots=plotting.get_default_plot_config(geo),
+        min_refresh_interval=3600.0,
+    )
+    num_refreshes = 0
+
+    def count_refreshes():
+      nonlocal num_refreshes
+      num_refreshes += 1
+
+    observer.update_plots = count_refreshes
+    for _ in range(3):
+      observer.after_step()
+    self.assertEqual(num_refreshes, 1)
+    observer.reset()
+    observer.after_step()
+    self.assertEqual(num_refreshes, 2)
+
 
 def _run_sim_with_sources(
     runtime_params: general_runtime_params.GeneralRuntimeParams,
@@ -17,11 +17,12 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 import chex
 import jax
 from jax import numpy as jnp
+import numpy as np
 
 from torax import geometry
 from torax.config import config_args
@@ -252,21 +253,43 @@ class ToraxSimState:
 
 
 def build_history_from_states(
-    states: tuple[ToraxSimState, ...],
+    states: Sequence[ToraxSimState],
+    on_host: bool = False,
 ) -> tuple[CoreProfiles, source_profiles.SourceProfiles, CoreTransport]:
-  core_profiles = [state.core_profiles.history_elem() for state in states]
-  core_sources = [state.core_sources for state in states]
-  transport = [state.core_transport for state in states]
-  stack = lambda *ys: jnp.stack(ys)
-  return (
-      jax.tree_util.tree_map(stack, *core_profiles),
-      jax.tree_util.tree_map(stack, *core_sources),
-      jax.tree_util.tree_map(stack, *transport),
-  )
+  """Stacks the profiles, sources and transport of all states over time.
+
+  Args:
+    states: States to stack, in time order.
+    on_host: If True, all of the states' outputs are fetched from the device in
+      a single transfer and stacked into numpy arrays. This is cheaper when the
+      history is only going to be written out, e.g. to an xr.Dataset.
+
+  Returns:
+    The core profiles, sources and transport with a leading time axis on each
+    leaf.
+  """
+  # Gather each state's outputs once and stack them in a single pass over the
+  # leaves, rather than walking the states separately for every output.
+  histories = [
+      (
+          state.core_profiles.history_elem(),
+          state.core_sources,
+          state.core_transport,
+      )
+      for state in states
+  ]
+  if on_host:
+    return jax.tree_util.tree_map(
+        lambda *ys: np.stack(ys), *jax.device_get(histories)
+    )
+  return jax.tree_util.tree_map(lambda *ys: jnp.stack(ys), *histories)
 
 
 def build_time_history_from_states(
-    states: tuple[ToraxSimState, ...],
+    states: Sequence[ToraxSimState],
+    on_host: bool = False,
 ) -> jnp.ndarray:
   times = [state.t for state in states]
+  if on_host:
+    return np.array(jax.device_get(times))
   return jnp.array(times)
@@ -26,7 +26,6 @@ import jax
 from torax import geometry
 from torax import sim
 from torax import state
-from torax.config import config_args
 from torax.config import runtime_params_slice
 from torax.fvm import cell_variable
 from torax.fvm import enums
@@ -141,12 +140,16 @@ class OptimizerRuntimeParams(runtime_params_lib.RuntimeParams):
   def build_dynamic_params(
       self, t: chex.Numeric
   ) -> DynamicOptimizerRuntimeParams:
+    # None of these fields are interpolated in time, so set them directly
+    # rather than going through config_args.get_init_kwargs.
+    del t  # Unused.
     return DynamicOptimizerRuntimeParams(
-        **config_args.get_init_kwargs(
-            input_config=self,
-            output_type=DynamicOptimizerRuntimeParams,
-            t=t,
-        )
+        chi_per=float(self.chi_per),
+        d_per=float(self.d_per),
+        corrector_steps=self.corrector_steps,
+        initial_guess_mode=self.initial_guess_mode.value,
+        maxiter=self.maxiter,
+        tol=float(self.tol),
     )
 
 
@@ -264,12 +267,20 @@ class NewtonRaphsonRuntimeParams(runtime_params_lib.RuntimeParams):
   def build_dynamic_params(
       self, t: chex.Numeric
   ) -> DynamicNewtonRaphsonRuntimeParams:
+    # None of these fields are interpolated in time, so set them directly
+    # rather than going through config_args.get_init_kwargs.
+    del t  # Unused.
     return DynamicNewtonRaphsonRuntimeParams(
-        **config_args.get_init_kwargs(
-            input_config=self,
-            output_type=DynamicNewtonRaphsonRuntimeParams,
-            t=t,
-        )
+        chi_per=float(self.chi_per),
+        d_per=float(self.d_per),
+        corrector_steps=self.corrector_steps,
+        log_iterations=self.log_iterations,
+        initial_guess_mode=self.initial_guess_mode.value,
+        maxiter=self.maxiter,
+        tol=float(self.tol),
+        coarse_tol=float(self.coarse_tol),
+        delta_reduction_factor=float(self.delta_reduction_factor),
+        tau_min=float(self.tau_min),
     )
 
 
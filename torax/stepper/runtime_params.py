@@ -89,12 +89,27 @@ class RuntimeParams:
     )
 
   def build_static_params(self) -> StaticRuntimeParams:
-    return StaticRuntimeParams(
-        **config_args.get_init_kwargs(
-            input_config=self,
-            output_type=StaticRuntimeParams,
-        )
+    # A static runtime params slice is built whenever a sim is built or updated,
+    # so reuse the last static params for as long as the fields they are built
+    # from are unchanged. This also lets jitted functions find them in their
+    # caches by identity. This is a plain lazily set attribute rather than a
+    # functools.cached_property, since the fields of this dataclass can be
+    # changed after the first call and a cached_property would then go stale.
+    values = tuple(getattr(self, name) for name in _STATIC_FIELD_NAMES)
+    cached = getattr(self, '_static_params', None)
+    if cached is not None and cached[0] == values:
+      return cached[1]
+    # The static fields are a plain subset of the fields of this class, so set
+    # them directly rather than going through config_args.get_init_kwargs.
+    static_params = StaticRuntimeParams(
+        theta_imp=float(self.theta_imp),
+        convection_dirichlet_mode=self.convection_dirichlet_mode,
+        convection_neumann_mode=self.convection_neumann_mode,
+        use_pereverzev=self.use_pereverzev,
+        predictor_corrector=self.predictor_corrector,
     )
+    self._static_params = (values, static_params)
+    return static_params
 
 
 @chex.dataclass(frozen=True)
@@ -117,6 +132,11 @@ class StaticRuntimeParams:
   predictor_corrector: bool
 
 
+_STATIC_FIELD_NAMES = tuple(
+    field.name for field in dataclasses.fields(StaticRuntimeParams)
+)
+
+
 def _check_config_param_in_set(
     param_name: str,
     param_value: Any,
@@ -19,9 +19,11 @@ from absl.testing import parameterized
 import numpy as np
 from torax import core_profile_setters
 from torax import geometry
+from torax import jax_utils
 from torax import physics
 from torax.config import runtime_params as general_runtime_params
 from torax.config import runtime_params_slice as runtime_params_slice_lib
+from torax.sources import source_models as source_models_lib
 from torax.stepper import runtime_params as stepper_params_lib
 from torax.transport_model import runtime_params as transport_params_lib
 
@@ -33,9 +35,12 @@ SMALL_VALUE = 1e-6
 class CoreProfileSettersTest(parameterized.TestCase):
   """Unit tests for setting the core profiles."""
 
-  def setUp(self):
-    super().setUp()
-    self.geo = geometry.build_circular_geometry(nr=4)
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # Geometries are immutable, so build the one shared by all (parameterized)
+    # test cases only once.
+    cls.geo = geometry.build_circular_geometry(nr=4)
 
   @parameterized.parameters(
       (0.0, np.array([10.5, 7.5, 4.5, 1.5])),
@@ -64,7 +69,7 @@ class CoreProfileSettersTest(parameterized.TestCase):
             Te_bound_right=SMALL_VALUE,
         ),
     )
-    geo = geometry.build_circular_geometry(nr=4)
+    geo = self.geo
     dynamic_slice = runtime_params_slice_lib.build_dynamic_runtime_params_slice(
         runtime_params,
         t=t,
@@ -112,7 +117,7 @@ class CoreProfileSettersTest(parameterized.TestCase):
         ),
     )
     t = 0.0
-    geo = geometry.build_circular_geometry(nr=4)
+    geo = self.geo
     dynamic_slice = runtime_params_slice_lib.build_dynamic_runtime_params_slice(
         runtime_params,
         t=t,
@@ -149,7 +154,7 @@ class CoreProfileSettersTest(parameterized.TestCase):
         sources_getter=lambda: {},
         stepper_getter=stepper_params_lib.RuntimeParams,
     )
-    geo = geometry.build_circular_geometry(nr=4)
+    geo = self.geo
 
     dynamic_runtime_params_slice = provider(t=1.0, geo=geo)
     Ti = core_profile_setters.updated_ion_temperature(
@@ -305,6 +310,52 @@ class CoreProfileSettersTest(parameterized.TestCase):
     np.all(np.isclose(ratio, ratio[0]))
     self.assertNotEqual(ratio[0], 1.0)
 
+  def test_prescribed_temp_ion_unchanged_when_evolution_disabled(self):
+    """Tests that disabled evolution skips the prescribed Ti update and checks."""
+    runtime_params = general_runtime_params.GeneralRuntimeParams(
+        numerics=general_runtime_params.Numerics(
+            ion_heat_eq=False,
+            enable_prescribed_profile_evolution=False,
+        ),
+    )
+    source_models_builder = source_models_lib.SourceModelsBuilder()
+    static_runtime_params_slice = (
+        runtime_params_slice_lib.build_static_runtime_params_slice(
+            runtime_params
+        )
+    )
+    initial_dynamic_runtime_params_slice = (
+        runtime_params_slice_lib.build_dynamic_runtime_params_slice(
+            runtime_params,
+            sources=source_models_builder.runtime_params,
+            geo=self.geo,
+        )
+    )
+    core_profiles = core_profile_setters.initial_core_profiles(
+        initial_dynamic_runtime_params_slice,
+        self.geo,
+        source_models=source_models_builder(),
+    )
+    runtime_params.profile_conditions.Ti_bound_right = -1.0
+    dynamic_runtime_params_slice = (
+        runtime_params_slice_lib.build_dynamic_runtime_params_slice(
+            runtime_params,
+            sources=source_models_builder.runtime_params,
+            t=1.0,
+            geo=self.geo,
+        )
+    )
+    with jax_utils.enable_errors(True):
+      updated = core_profile_setters.updated_prescribed_core_profiles(
+          static_runtime_params_slice,
+          dynamic_runtime_params_slice,
+          self.geo,
+          core_profiles,
+      )
+    np.testing.assert_array_equal(
+        updated["temp_ion"], core_profiles.temp_ion.value
+    )
+
   @parameterized.parameters(True, False,)
   def test_ne_core_profile_setter_with_fGW(
       self, normalize_to_nbar: bool,
@@ -22,6 +22,8 @@ import jax
 from jax import numpy as jnp
 import numpy as np
 from torax import geometry
+from torax import geometry_loader
+from torax import geometry_provider
 
 
 class GeometryTest(parameterized.TestCase):
@@ -55,6 +57,33 @@ class GeometryTest(parameterized.TestCase):
     with self.assertRaises(dataclasses.FrozenInstanceError):
       geo.dr_norm = 0.1
 
+  def test_geometry_is_compared_by_identity(self):
+    """Test that geometries are hashable and equal only to themselves."""
+    geo = geometry.build_circular_geometry()
+    other_geo = geometry.build_circular_geometry()
+    self.assertEqual(geo, geo)
+    self.assertNotEqual(geo, other_geo)
+    self.assertEqual(hash(geo), hash(geo))
+
+  def test_grid_equality(self):
+    """Test that grids are equal iff they have the same faces."""
+    grid = geometry.Grid1D.construct(nx=10, dx=0.1)
+    self.assertEqual(grid, geometry.Grid1D.construct(nx=10, dx=0.1))
+    self.assertNotEqual(grid, geometry.Grid1D.construct(nx=10, dx=0.2))
+    self.assertNotEqual(grid, geometry.Grid1D.construct(nx=11, dx=0.1))
+    self.assertLen({grid, geometry.Grid1D.construct(nx=10, dx=0.1)}, 1)
+
+  def test_constant_geometry_provider_can_be_input_to_jitted_function(self):
+    """Test that a ConstantGeometryProvider can be input to a jitted fn."""
+    geo = geometry.build_circular_geometry()
+    provider = geometry_provider.ConstantGeometryProvider(geo)
+
+    @jax.jit
+    def f(provider, t):
+      return provider(t).Rmaj
+
+    np.testing.assert_allclose(f(provider, 1.0), geo.Rmaj)
+
   def test_circular_geometry_can_be_input_to_jitted_function(self):
     """Test that a circular geometry can be input to a jitted function."""
 
@@ -105,6 +134,27 @@ class GeometryTest(parameterized.TestCase):
     intermediate = geometry.StandardGeometryIntermediates.from_chease()
     geometry.build_standard_geometry(intermediate)
 
+  def test_chease_file_is_parsed_once(self):
+    """Tests that loading the same CHEASE file twice reuses the parsed data."""
+    geometry_file = 'ITER_hybrid_citrin_equil_cheasedata.mat2cols'
+    first = geometry_loader.load_chease_data(None, geometry_file)
+    second = geometry_loader.load_chease_data(None, geometry_file)
+    self.assertIsNot(first, second)
+    self.assertEqual(first.keys(), second.keys())
+    for key in first:
+      self.assertIs(first[key], second[key])
+
+  def test_interp_onto_matches_np_interp(self):
+    """Tests that the precomputed interpolation matches np.interp."""
+    rng = np.random.default_rng(seed=20240612)
+    xp = np.concatenate([[0.0], np.sort(rng.uniform(size=30)), [1.0]])
+    # Include points outside of xp and exactly on xp.
+    x = np.concatenate([np.linspace(-0.1, 1.1, 50), xp])
+    interp = geometry._make_interp_onto(x, xp)  # pylint: disable=protected-access
+    for _ in range(3):
+      fp = rng.normal(size=xp.shape)
+      np.testing.assert_array_equal(interp(fp), np.interp(x, xp, fp))
+
 
 def face_to_cell(nr, face):
   cell = np.zeros(nr)
@@ -21,6 +21,7 @@ import jax
 from jax import numpy as jnp
 import numpy as np
 from torax import interpolated_param
+from torax import jax_utils
 
 
 class InterpolatedParamTest(parameterized.TestCase):
@@ -38,6 +39,23 @@ class InterpolatedParamTest(parameterized.TestCase):
     np.testing.assert_allclose(single_value_param.get_value(0), expected_output)
     np.testing.assert_allclose(single_value_param.get_value(1), expected_output)
 
+  @parameterized.parameters(
+      (42.0, interpolated_param.InterpolationMode.PIECEWISE_LINEAR),
+      ({1.0: 42.0}, interpolated_param.InterpolationMode.STEP),
+  )
+  def test_single_value_param_broadcasts_to_input_shape(
+      self, value, interpolation_mode
+  ):
+    """Tests the constant fast path matches interpolating the param."""
+    single_value_param = interpolated_param.InterpolatedVar1d(
+        value, interpolation_mode
+    )
+    x = np.linspace(-1.0, 2.0, 4)
+    output = single_value_param.get_value(x)
+    self.assertEqual(output.shape, x.shape)
+    np.testing.assert_allclose(output, single_value_param.param.get_value(x))
+    np.testing.assert_allclose(jax.jit(single_value_param.get_value)(x), output)
+
   @parameterized.parameters(
       (
           {0.0: 0.0, 1.0: 1.0, 2.0: 2.0, 3.0: 3.0},
@@ -151,6 +169,176 @@ class InterpolatedParamTest(parameterized.TestCase):
           expected_output,
       )
 
+  @parameterized.parameters(
+      (3,),
+      ({0: 1, 2: 3},),
+      ({0.0: True, 1.0: False},),
+  )
+  def test_interpolated_var_1d_stores_float_dtype(self, value):
+    """Tests that xs and ys are stored in the configured float dtype."""
+    param = interpolated_param.InterpolatedVar1d(value).param
+    self.assertEqual(param.xs.dtype, jax_utils.get_dtype())
+    self.assertEqual(param.ys.dtype, jax_utils.get_dtype())
+
+  def test_interpolated_var_1d_can_store_a_lower_precision(self):
+    """Tests that xs and ys can be stored in a given float dtype."""
+    param = interpolated_param.InterpolatedVar1d(
+        {0.0: 1.0, 2.0: 3.0}, dtype=jnp.float32
+    )
+    self.assertEqual(param.param.xs.dtype, jnp.float32)
+    self.assertEqual(param.param.ys.dtype, jnp.float32)
+    np.testing.assert_allclose(param.get_value(0.5), 1.5)
+
+  @parameterized.parameters(
+      ({0.0: 1.0, 2.0: 3.0}, 'piecewise_linear', jnp.float64),
+      (1.0, 'piecewise_linear', jnp.float64),
+      ({0.0: 1.0, 2.0: 3.0}, 'step', jnp.float32),
+      (1.0, 'step', jnp.float32),
+  )
+  def test_interpolated_var_1d_dtype_is_the_same_on_all_paths(
+      self, value, interpolation_mode, expected_dtype
+  ):
+    """Tests eager, constant and jitted lookups promote x the same way."""
+    param = interpolated_param.InterpolatedVar1d(
+        value,
+        interpolated_param.InterpolationMode[interpolation_mode.upper()],
+        dtype=jnp.float32,
+    )
+    get_value = jax.jit(lambda param, x: param.get_value(x))
+    # Piecewise-linear lookups are promoted to the dtype of x, step lookups
+    # are not.
+    x = np.array([0.5, 1.0], dtype=np.float64)
+    self.assertEqual(param.get_value(x).dtype, expected_dtype)
+    self.assertEqual(get_value(param, x).dtype, expected_dtype)
+    # Python floats do not promote.
+    self.assertEqual(param.get_value(0.5).dtype, jnp.float32)
+    self.assertEqual(get_value(param, 0.5).dtype, jnp.float32)
+
+  def test_params_with_same_knots_share_xs(self):
+    """Tests that params given at the same knots share one xs array."""
+    param_1 = interpolated_param.InterpolatedVar1d({0.0: 1.0, 2.0: 3.0})
+    param_2 = interpolated_param.InterpolatedVar1d({0.0: 5.0, 2.0: 1.0})
+    param_3 = interpolated_param.InterpolatedVar1d({0.0: 5.0, 3.0: 1.0})
+    self.assertIs(param_1.param.xs, param_2.param.xs)
+    self.assertIsNot(param_1.param.xs, param_3.param.xs)
+    np.testing.assert_allclose(param_2.get_value(1.0), 3.0)
+
+  def test_interpolated_var_2d_stores_float_times(self):
+    """Tests that integer times are stored in the configured float dtype."""
+    var_2d = interpolated_param.InterpolatedVar2d(
+        {1: {0.0: 1.0, 1.0: 2.0}, 0: {0.0: 0.0, 1.0: 1.0}}
+    )
+    self.assertEqual(var_2d.sorted_indices.dtype, jax_utils.get_dtype())
+    np.testing.assert_array_equal(var_2d.sorted_indices, [0.0, 1.0])
+    np.testing.assert_allclose(
+        var_2d.get_value(0.5, np.array([0.0, 1.0])), [0.5, 1.5]
+    )
+
+  def test_step_interpolated_param_can_be_jitted(self):
+    """Tests that step interpolation works with a traced coordinate."""
+    multi_val_range = interpolated_param.InterpolatedVar1d(
+        {0.0: 1.0, 2.0: 3.0, 3.0: 5.0},
+        interpolated_param.InterpolationMode.STEP,
+    )
+    get_value = jax.jit(multi_val_range.get_value)
+    for x in (-1.0, 0.0, 1.0, 2.0, 2.5, 4.0):
+      np.testing.assert_allclose(get_value(x), multi_val_range.get_value(x))
+
+  def test_piecewise_linear_param_matches_np_interp(self):
+    """Tests piecewise-linear interpolation against np.interp."""
+    rng = np.random.default_rng(seed=20240701)
+    xs = np.sort(rng.uniform(size=20))
+    ys = rng.normal(size=20)
+    # Include points outside of xs and exactly on xs.
+    x = np.concatenate([[-1.0, 2.0], xs, rng.uniform(-0.1, 1.1, size=50)])
+    param = interpolated_param.PiecewiseLinearInterpolatedParam(
+        xs=jnp.array(xs), ys=jnp.array(ys)
+    )
+    np.testing.assert_allclose(param.get_value(x), np.interp(x, xs, ys))
+    np.testing.assert_allclose(
+        jax.jit(param.get_value)(x), np.interp(x, xs, ys)
+    )
+
+  @parameterized.parameters(
+      (np.array([0.0, 1.0, 4.0]),),
+      (np.linspace(0.0, 1.0, 11),),
+  )
+  def test_piecewise_linear_param_is_exact_at_the_knots(self, xs):
+    """Tests the values at and beyond the knots are ys, without rounding."""
+    ys = np.random.default_rng(seed=20240702).normal(size=xs.shape)
+    param = interpolated_param.PiecewiseLinearInterpolatedParam(
+        xs=jnp.array(xs), ys=jnp.array(ys)
+    )
+    x = np.concatenate([xs, [xs[0] - 1.0, xs[-1] + 1.0]])
+    expected = np.concatenate([ys, [ys[0], ys[-1]]])
+    np.testing.assert_array_equal(param.get_value(jnp.array(x)), expected)
+    np.testing.assert_array_equal(jax.jit(param.get_value)(x), expected)
+    np.testing.assert_array_equal(param.get_value(x), expected)
+
+  def test_piecewise_linear_param_with_evenly_spaced_xs(self):
+    """Tests the lookup for evenly spaced xs against np.interp."""
+    xs = np.linspace(0.0, 2.0, 11)
+    ys = np.sin(xs)
+    x = np.concatenate([[-1.0, 3.0], xs, np.linspace(-0.05, 2.05, 101)])
+    param = interpolated_param.PiecewiseLinearInterpolatedParam(
+        xs=jnp.array(xs), ys=jnp.array(ys)
+    )
+    np.testing.assert_allclose(param.get_value(x), np.interp(x, xs, ys))
+    np.testing.assert_allclose(
+        jax.jit(param.get_value)(x), np.interp(x, xs, ys)
+    )
+
+  def test_piecewise_linear_param_looks_up_numpy_inputs_on_host(self):
+    """Tests that NumPy inputs are looked up with NumPy, like under jit."""
+    param = interpolated_param.PiecewiseLinearInterpolatedParam(
+        xs=jnp.array([0.0, 1.0, 3.0]), ys=jnp.array([1.0, 3.0, 2.0])
+    )
+    for x in (
+        np.array([-1.0, 0.0, 1.0, 3.0, 4.0]),
+        np.array([0.5, 2.0], dtype=np.float32),
+        2.0,
+    ):
+      value = param.get_value(x)
+      expected = jax.jit(param.get_value)(x)
+      self.assertIsInstance(value, jax.Array)
+      self.assertEqual(value.dtype, expected.dtype)
+      self.assertEqual(value.shape, expected.shape)
+      np.testing.assert_allclose(value, expected)
+    np.testing.assert_array_equal(
+        param.get_value(np.array([-1.0, 0.0, 1.0, 3.0, 4.0])),
+        [1.0, 1.0, 3.0, 2.0, 2.0],
+    )
+
+  @parameterized.parameters(
+      interpolated_param.InterpolationMode.PIECEWISE_LINEAR,
+      interpolated_param.InterpolationMode.STEP,
+  )
+  def test_interpolated_var_1d_can_be_input_to_jitted_function(
+      self, interpolation_mode
+  ):
+    """Tests that params with the same shape share one compiled function."""
+    trace_count = 0
+
+    @jax.jit
+    def get_value(param, x):
+      nonlocal trace_count
+      trace_count += 1
+      return param.get_value(x)
+
+    for values in (
+        {0.0: 1.0, 2.0: 3.0, 3.0: 5.0},
+        {0.0: 2.0, 1.0: 4.0, 4.0: 0.0},
+        {0.0: True, 1.0: False, 2.0: True},
+    ):
+      param = interpolated_param.InterpolatedVar1d(values, interpolation_mode)
+      for x in (0.5, 2.5):
+        np.testing.assert_allclose(get_value(param, x), param.get_value(x))
+      # At the knots and outside of them, both give exactly the given values.
+      for x in (-1.0, *values, 5.0):
+        np.testing.assert_array_equal(get_value(param, x), param.get_value(x))
+    # The bool param has different aux data, so needs its own trace.
+    self.assertEqual(trace_count, 2)
+
   def test_dict_range_input_must_have_values(self):
     with self.assertRaises(ValueError):
       interpolated_param.InterpolatedVar1d({})
@@ -368,6 +556,80 @@ class InterpolatedParamTest(parameterized.TestCase):
         interpolated_var_2d.get_value(time=0.5, rho=0.95), 5.0
     )
 
+  def test_interpolated_var_2d_reuses_values_on_rho_grid(self):
+    """Tests that repeated calls on one rho grid give the same results."""
+    values = {
+        0.0: {0: 0.0, 1: 0.0},
+        1.0: {0: 0.0, 0.3: 0.5, 0.8: 1.0, 1: 1.0},
+        2.0: {0: 1.0, 0.5: 0},
+    }
+    rho = np.array([0.1, 0.5, 0.6])
+    interpolated_var_2d = interpolated_param.InterpolatedVar2d(values)
+    for time in (-1.0, 0.5, 1.0, 1.2, 3.0):
+      expected = interpolated_param.InterpolatedVar2d(values).get_value(
+          time=time, rho=rho.copy()
+      )
+      np.testing.assert_allclose(
+          interpolated_var_2d.get_value(time=time, rho=rho), expected
+      )
+    # Interpolating in time also works when jitted.
+    get_value = jax.jit(interpolated_var_2d.get_value)
+    for time in (-1.0, 0.5, 1.0, 1.2, 3.0):
+      np.testing.assert_allclose(
+          get_value(time, rho),
+          interpolated_var_2d.get_value(time=time, rho=rho),
+          rtol=1e-6,
+      )
+    # A different rho grid is interpolated separately.
+    np.testing.assert_allclose(
+        interpolated_var_2d.get_value(time=1.0, rho=np.array([0.3, 0.8])),
+        np.array([0.5, 1.0]),
+    )
+
+  @parameterized.parameters(
+      interpolated_param.InterpolationMode.PIECEWISE_LINEAR,
+      interpolated_param.InterpolationMode.STEP,
+  )
+  def test_interpolated_var_2d_with_shared_knots_and_traced_rho(
+      self, rho_interpolation_mode
+  ):
+    """Tests blending in time first for profiles given at the same knots."""
+    values = {
+        0.0: {0.0: 1.0, 0.5: 2.0, 1.0: 0.0},
+        1.0: {0.0: 3.0, 0.5: 0.0, 1.0: 1.0},
+        2.0: {0.0: 0.0, 0.5: 1.0, 1.0: 4.0},
+    }
+    interpolated_var_2d = interpolated_param.InterpolatedVar2d(
+        values, rho_interpolation_mode
+    )
+    get_value = jax.jit(interpolated_var_2d.get_value)
+    rho = np.array([0.0, 0.2, 0.5, 0.7, 1.0])
+    for time in (-1.0, 0.0, 0.3, 1.0, 1.5, 3.0):
+      np.testing.assert_allclose(
+          get_value(time, rho),
+          interpolated_var_2d.get_value(time=time, rho=rho),
+      )
+
+  def test_interpolated_var_2d_looks_up_many_times_at_once(self):
+    """Tests that an array of times gives one row per time."""
+    values = {
+        0.0: {0.0: 0.0, 1.0: 0.0},
+        1.0: {0.0: 0.0, 0.3: 0.5, 0.8: 1.0, 1.0: 1.0},
+        2.0: {0.0: 1.0, 0.5: 0.0},
+    }
+    interpolated_var_2d = interpolated_param.InterpolatedVar2d(values)
+    times = np.array([-1.0, 0.5, 1.0, 1.2, 3.0])
+    rho = np.array([0.1, 0.5, 0.6])
+    expected = np.stack(
+        [interpolated_var_2d.get_value(time=t, rho=rho) for t in times]
+    )
+    np.testing.assert_allclose(
+        interpolated_var_2d.get_value(time=times, rho=rho), expected
+    )
+    np.testing.assert_allclose(
+        jax.jit(interpolated_var_2d.get_value)(times, rho), expected
+    )
+
 
 if __name__ == '__main__':
   absltest.main()
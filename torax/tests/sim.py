@@ -427,6 +427,31 @@ class SimTest(sim_test_case.SimTestCase):
             )
             raise AssertionError(msg)
 
+  def test_run_without_state_history_keeps_first_and_last_states(self):
+    runtime_params = torax.general_runtime_params.GeneralRuntimeParams(
+        numerics=torax.general_runtime_params.Numerics(t_final=0.1),
+    )
+    sim = sim_lib.build_sim_object(
+        runtime_params=runtime_params,
+        geo=torax.build_circular_geometry(),
+        stepper_builder=linear_theta_method.LinearThetaMethodBuilder(),
+        transport_model_builder=constant_transport_model.ConstantTransportModelBuilder(),
+        source_models_builder=source_models_lib.SourceModelsBuilder(),
+        time_step_calculator=chi_time_step_calculator.ChiTimeStepCalculator(),
+    )
+
+    full_history = sim.run()
+    short_history = sim.run(keep_state_history=False)
+
+    self.assertGreater(len(full_history), 2)
+    self.assertLen(short_history, 2)
+    np.testing.assert_allclose(short_history[0].t, full_history[0].t)
+    np.testing.assert_allclose(short_history[-1].t, full_history[-1].t)
+    np.testing.assert_allclose(
+        short_history[-1].core_profiles.temp_ion.value,
+        full_history[-1].core_profiles.temp_ion.value,
+    )
+
   @parameterized.named_parameters(
       (
           'implicit_update',
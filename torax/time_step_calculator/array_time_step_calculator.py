@@ -38,6 +38,9 @@ class ArrayTimeStepCalculator(time_step_calculator.TimeStepCalculator[State]):
   def __init__(self, arr: chex.Array):
     super().__init__()
     self.arr = jnp.asarray(arr)
+    # All of the steps are known up front, so take their differences once
+    # rather than indexing and subtracting on every step.
+    self._dts = jnp.diff(self.arr)
 
   def initial_state(self) -> State:
     return 0
@@ -73,4 +76,4 @@ class ArrayTimeStepCalculator(time_step_calculator.TimeStepCalculator[State]):
     )  # Unused.
     idx = time_step_calculator_state
     idx += 1
-    return self.arr[idx] - self.arr[idx - 1], idx
+    return self._dts[idx - 1], idx
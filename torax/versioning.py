@@ -20,6 +20,8 @@ This ensures that changes to Torax itself cause new code with the new
 Torax behavior to be compiled and executed, rather than old cached code with
 the old behavior to be executed.
 """
+import functools
+
 from torax import list_files
 
 
@@ -51,7 +53,17 @@ def calc_torax_hash() -> int:
   return hash(module_contents)
 
 
-# We calculate this once on import so it can be reused many times, otherwise
-# hash functions of all the torax classes would be slow.
-torax_hash = calc_torax_hash()
+@functools.lru_cache(maxsize=None)
+def _get_torax_hash() -> int:
+  return calc_torax_hash()
+
+
+def __getattr__(name: str) -> int:
+  # `torax_hash` is calculated once, so it can be reused many times, otherwise
+  # hash functions of all the torax classes would be slow. It is calculated on
+  # first access rather than on import, since reading all the source files is
+  # not needed just to import torax, e.g. to build or validate a config.
+  if name == 'torax_hash':
+    return _get_torax_hash()
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 